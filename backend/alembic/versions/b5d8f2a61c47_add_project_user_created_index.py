@@ -0,0 +1,31 @@
+"""Add composite index for keyset pagination of projects
+
+Revision ID: b5d8f2a61c47
+Revises: f3c9e1a4b752
+Create Date: 2026-10-16 19:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b5d8f2a61c47'
+down_revision: Union[str, None] = 'f3c9e1a4b752'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create ix_project_user_created (user_id, created_at, id)."""
+    op.create_index(
+        'ix_project_user_created',
+        'project',
+        ['user_id', 'created_at', 'id'],
+    )
+
+
+def downgrade() -> None:
+    """Drop ix_project_user_created."""
+    op.drop_index('ix_project_user_created', table_name='project')
@@ -0,0 +1,42 @@
+"""Match ix_source_pending predicate to the pending processing filter
+
+Revision ID: c6e2a9d4f185
+Revises: b5d8f2a61c47
+Create Date: 2026-10-16 21:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c6e2a9d4f185'
+down_revision: Union[str, None] = 'b5d8f2a61c47'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Recreate ix_source_pending WHERE processed_content IS NULL OR processed_content = ''."""
+    op.drop_index('ix_source_pending', table_name='source')
+    op.create_index(
+        'ix_source_pending',
+        'source',
+        ['project_id'],
+        postgresql_where=sa.text("processed_content IS NULL OR processed_content = ''"),
+        sqlite_where=sa.text("processed_content IS NULL OR processed_content = ''"),
+    )
+
+
+def downgrade() -> None:
+    """Restore ix_source_pending WHERE processed_content IS NULL."""
+    op.drop_index('ix_source_pending', table_name='source')
+    op.create_index(
+        'ix_source_pending',
+        'source',
+        ['project_id'],
+        postgresql_where=sa.text('processed_content IS NULL'),
+        sqlite_where=sa.text('processed_content IS NULL'),
+    )
@@ -0,0 +1,34 @@
+"""Add partial index on source for pending processing lookups
+
+Revision ID: d41f7a9c2e68
+Revises: a7b8c9d0e1f2
+Create Date: 2026-10-16 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd41f7a9c2e68'
+down_revision: Union[str, None] = 'a7b8c9d0e1f2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create ix_source_pending (project_id) WHERE processed_content IS NULL."""
+    op.create_index(
+        'ix_source_pending',
+        'source',
+        ['project_id'],
+        postgresql_where=sa.text('processed_content IS NULL'),
+        sqlite_where=sa.text('processed_content IS NULL'),
+    )
+
+
+def downgrade() -> None:
+    """Drop ix_source_pending."""
+    op.drop_index('ix_source_pending', table_name='source')
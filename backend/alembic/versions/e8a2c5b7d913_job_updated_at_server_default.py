@@ -0,0 +1,44 @@
+"""Set database-side default for job updated_at
+
+Revision ID: e8a2c5b7d913
+Revises: d41f7a9c2e68
+Create Date: 2026-10-16 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e8a2c5b7d913'
+down_revision: Union[str, None] = 'd41f7a9c2e68'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+JOB_TABLES = ('processing_job', 'generation_job')
+
+
+def upgrade() -> None:
+    """Default updated_at to now() on insert."""
+    for table in JOB_TABLES:
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.alter_column(
+                'updated_at',
+                existing_type=sa.DateTime(timezone=True),
+                existing_nullable=False,
+                server_default=sa.func.now(),
+            )
+
+
+def downgrade() -> None:
+    """Drop the updated_at server default."""
+    for table in JOB_TABLES:
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.alter_column(
+                'updated_at',
+                existing_type=sa.DateTime(timezone=True),
+                existing_nullable=False,
+                server_default=None,
+            )
@@ -0,0 +1,32 @@
+"""Add content_hash to source
+
+Revision ID: f3c9e1a4b752
+Revises: e8a2c5b7d913
+Create Date: 2026-10-16 18:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3c9e1a4b752'
+down_revision: Union[str, None] = 'e8a2c5b7d913'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add nullable source.content_hash.
+
+    Existing rows stay NULL; indexing hashes their text on the fly and the
+    column fills in the next time their content is written.
+    """
+    op.add_column('source', sa.Column('content_hash', sa.String(length=64), nullable=True))
+
+
+def downgrade() -> None:
+    """Drop source.content_hash."""
+    op.drop_column('source', 'content_hash')
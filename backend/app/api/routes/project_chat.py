@@ -40,6 +40,9 @@ async def list_chat_sessions(
     if not project:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Project not found")
     
+    # Opening the chat panel: get the RAG index ready before the first message
+    service.prewarm(project_id)
+    
     sessions_with_counts = await service.list_sessions(project_id)
     session_reads = [
         ChatSessionRead(
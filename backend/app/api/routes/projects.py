@@ -1,11 +1,12 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 import tempfile
 from pathlib import Path
 
 from fastapi import APIRouter, BackgroundTasks, Depends, File, UploadFile, status, Response, HTTPException, Query
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, StreamingResponse
 from pydantic import BaseModel, Field
 
 from app.api.deps import get_db_session, get_file_service
@@ -26,13 +27,19 @@ from app.schemas import (
     SourceUpdate,
     TokenEstimation,
 )
-from app.schemas.pagination import PaginatedResponse, PaginationParams
+from app.schemas.pagination import (
+    CursorPaginatedResponse,
+    CursorPaginationParams,
+    PaginatedResponse,
+    PaginationParams,
+)
 from app.services.projects import ProjectService
 from app.services.jobs import run_document_job, run_processing_job
+from app.workers import generation_queue, processing_queue
 from app.services.sources import SourceService
 from app.utils.text_extraction import extract_text_from_source
 from app.utils.tokens import (
-    estimate_tokens,
+    estimate_tokens_batch,
     format_token_count,
     get_context_usage_percentage,
     MISTRAL_CONTEXT_LIMIT,
@@ -89,6 +96,21 @@ async def list_projects(service: ProjectService = Depends(get_project_service))
     return await service.list_projects()
 
 
+@router.get("/stream", response_class=StreamingResponse)
+async def stream_projects(service: ProjectService = Depends(get_project_service)) -> StreamingResponse:
+    """
+    Stream all projects as newline-delimited JSON (one ProjectSummary per line).
+
+    Summaries are sent as they are read, so large project lists don't have
+    to be materialised before the first byte goes out.
+    """
+    async def generate():
+        async for summary in service.iter_projects():
+            yield summary.model_dump_json() + "\n"
+
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
+
+
 @router.get("/paginated", response_model=PaginatedResponse[ProjectSummary])
 async def list_projects_paginated(
     pagination: PaginationParams = Depends(),
@@ -116,6 +138,36 @@ async def list_projects_paginated(
     )
 
 
+@router.get("/cursor", response_model=CursorPaginatedResponse[ProjectSummary])
+async def list_projects_cursor(
+    pagination: CursorPaginationParams = Depends(),
+    service: ProjectService = Depends(get_project_service),
+) -> CursorPaginatedResponse[ProjectSummary]:
+    """
+    List projects with keyset (cursor) pagination.
+
+    Each page is an index seek from the previous page's last row, so deep
+    pages cost the same as the first one.
+
+    Query Parameters:
+        - cursor: next_cursor from the previous page (omit for the first page)
+        - limit: Number of items per page (1-100, default: 20)
+
+    Returns:
+        CursorPaginatedResponse with projects and the next page's cursor
+    """
+    projects, next_cursor = await service.list_projects_cursor(
+        cursor=pagination.cursor,
+        limit=pagination.limit
+    )
+    return CursorPaginatedResponse(
+        items=projects,
+        limit=pagination.limit,
+        next_cursor=next_cursor,
+        has_more=next_cursor is not None
+    )
+
+
 @router.post("", response_model=ProjectDetail, status_code=status.HTTP_201_CREATED)
 async def create_project(
     payload: ProjectCreate,
@@ -154,7 +206,6 @@ async def delete_project(
 # Rate limited globally by slowapi (200/minute default)
 async def upload_audio_source(
     project_id: int,
-    background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
     service: ProjectService = Depends(get_project_service),
     source_service: SourceService = Depends(get_source_service),
@@ -163,7 +214,7 @@ async def upload_audio_source(
     # Automatically trigger transcription for the uploaded audio source
     # Use 'mistral' as default provider (OpenAI is scaffold/future scope)
     default_provider = "mistral"
-    background_tasks.add_task(run_processing_job, project_id, default_provider)
+    processing_queue.enqueue(run_processing_job, project_id, default_provider)
     return source
 
 
@@ -191,7 +242,6 @@ async def import_youtube_source(
 # Rate limited globally by slowapi (200/minute default)
 async def upload_pdf_source(
     project_id: int,
-    background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
     service: ProjectService = Depends(get_project_service),
 ) -> SourceRead:
@@ -240,7 +290,7 @@ async def upload_pdf_source(
     # Automatically trigger OCR processing for the uploaded PDF source
     # Use 'mistral' as provider (OCR processing uses ProcessorRegistry)
     default_provider = "mistral"
-    background_tasks.add_task(run_processing_job, project_id, default_provider)
+    processing_queue.enqueue(run_processing_job, project_id, default_provider)
     return source
 
 
@@ -267,6 +317,7 @@ async def estimate_tokens_endpoint(
         sources = await source_service.get_sources_by_ids(project_id, None)
 
     total_tokens = 0
+    uncounted_texts: list[str] = []
     
     for source in sources:
         if source.token_count is not None:
@@ -276,8 +327,7 @@ async def estimate_tokens_endpoint(
             try:
                 text = extract_text_from_source(source)
                 if text and text.strip():
-                    count = estimate_tokens(text)
-                    total_tokens += count
+                    uncounted_texts.append(text)
             except Exception as e:
                 logger.warning(
                     "Failed to extract text for token estimation",
@@ -285,6 +335,10 @@ async def estimate_tokens_endpoint(
                 )
                 continue
 
+    if uncounted_texts:
+        # One batched encode, off the event loop
+        total_tokens += await asyncio.to_thread(estimate_tokens_batch, uncounted_texts)
+
     return TokenEstimation(
         total_tokens=total_tokens,
         formatted_count=format_token_count(total_tokens),
@@ -298,13 +352,12 @@ async def estimate_tokens_endpoint(
 async def start_document_generation(
     project_id: int,
     payload: DocumentRequest,
-    background_tasks: BackgroundTasks,
     service: ProjectService = Depends(get_project_service),
 ) -> JobStatusRead:
     """Generate document from project sources using LLM."""
     job = await service.start_document_job(project_id, payload.provider, payload.type)
     source_ids = payload.source_ids or None
-    background_tasks.add_task(
+    generation_queue.enqueue(
         run_document_job,
         project_id,
         payload.provider.lower(),
@@ -480,7 +533,6 @@ async def get_source_file(
 async def reprocess_source(
     project_id: int,
     source_id: int,
-    background_tasks: BackgroundTasks,
     service: SourceService = Depends(get_source_service),
     project_service: ProjectService = Depends(get_project_service),
 ) -> dict:
@@ -497,6 +549,6 @@ async def reprocess_source(
     
     # Trigger processing job again
     default_provider = "mistral"
-    background_tasks.add_task(run_processing_job, project_id, default_provider)
+    processing_queue.enqueue(run_processing_job, project_id, default_provider)
     
     return {"message": "Reprocessing started", "source_id": source_id}
@@ -2,7 +2,7 @@ from functools import lru_cache
 from pathlib import Path
 from typing import Literal
 
-from pydantic import Field, SecretStr, field_validator
+from pydantic import Field, SecretStr, field_validator, model_validator
 from pydantic_settings import BaseSettings
 
 
@@ -52,6 +52,61 @@ class AppSettings(BaseSettings):
     max_audio_bytes: int = Field(default=500 * 1024 * 1024, ge=1)
     max_audio_duration_seconds: int = Field(default=7200, ge=1)
 
+    max_processing_concurrency: int = Field(
+        default=4, ge=1, description="Sources transcribed/OCR'd in parallel per processing job"
+    )
+    processing_queue_workers: int = Field(
+        default=2, ge=1, description="Processing jobs (transcription/OCR) run at once"
+    )
+    generation_queue_workers: int = Field(
+        default=2, ge=1, description="Document generation jobs run at once"
+    )
+    job_queue_shutdown_timeout_seconds: float = Field(
+        default=30, ge=0, description="How long shutdown waits for queued jobs before failing them"
+    )
+    worker_db_pool_size: int | None = Field(
+        default=None,
+        ge=1,
+        description="Database connections reserved for background jobs (PostgreSQL only); "
+        "defaults to min_worker_db_pool_size",
+    )
+
+    @property
+    def min_worker_db_pool_size(self) -> int:
+        """Connections the background jobs can hold at once.
+
+        Each processing job keeps its own session plus one per source in
+        flight; each generation job uses one.
+        """
+        return (
+            self.processing_queue_workers * (self.max_processing_concurrency + 1)
+            + self.generation_queue_workers
+        )
+
+    @model_validator(mode="after")
+    def check_worker_db_pool_size(self) -> "AppSettings":
+        """Reject a worker pool too small for the configured queues (jobs would stall)."""
+        if (
+            self.worker_db_pool_size is not None
+            and self.worker_db_pool_size < self.min_worker_db_pool_size
+        ):
+            raise ValueError(
+                f"worker_db_pool_size={self.worker_db_pool_size} is below the "
+                f"{self.min_worker_db_pool_size} connections the job queues can hold"
+            )
+        return self
+
+    llm_cache_enabled: bool = Field(
+        default=True, description="Reuse generated documents for identical prompts"
+    )
+    llm_cache_ttl_seconds: int = Field(default=86400, ge=1)
+
+    rag_query_cache_min_similarity: float = Field(
+        default=0.97, ge=0.0, le=1.0,
+        description="Cosine similarity at which a paraphrased chat query reuses cached search results",
+    )
+    rag_query_cache_ttl_seconds: int = Field(default=7 * 86400, ge=1)
+
     environment: Literal["dev", "test", "prod"] = Field(default="dev")
     
     cors_allowed_origins: list[str] = Field(
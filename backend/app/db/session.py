@@ -1,9 +1,18 @@
+import json
+from functools import partial
+from typing import Any
+
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 
 from app.core.settings import settings
 
 
-def create_engine() -> AsyncEngine:
+# JSON columns (source and chat message metadata): compact separators and raw
+# UTF-8 instead of \uXXXX escapes keep the encoded payloads small
+_json_serializer = partial(json.dumps, separators=(",", ":"), ensure_ascii=False)
+
+
+def create_engine(**pool_options: Any) -> AsyncEngine:
     connect_args = {}
 
     # Configure for PostgreSQL + asyncpg (Supabase Pooler)
@@ -12,20 +21,39 @@ def create_engine() -> AsyncEngine:
         # Required because Supavisor in transaction mode doesn't support prepared statements
         connect_args["prepared_statement_cache_size"] = 0
         # SSL is handled automatically by Supabase Pooler - don't override
+    else:
+        # SQLite pools don't take sizing options
+        pool_options = {}
 
     return create_async_engine(
         settings.database_url,
         future=True,
         echo=False,
-        connect_args=connect_args
+        connect_args=connect_args,
+        json_serializer=_json_serializer,
+        **pool_options,
     )
 
 
 engine = create_engine()
 AsyncSessionLocal = async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
 
+# Background jobs hold connections for minutes from a small, fixed set of
+# workers: size the pool for all of them and skip the per-checkout pre-ping
+worker_engine = create_engine(
+    pool_size=settings.worker_db_pool_size or settings.min_worker_db_pool_size,
+    max_overflow=0,
+    pool_pre_ping=False,
+    pool_recycle=1800,
+)
+WorkerSessionLocal = async_sessionmaker(worker_engine, expire_on_commit=False, class_=AsyncSession)
+
 
 async def get_session():
     async with AsyncSessionLocal() as session:
         yield session
 
+
+async def get_worker_session():
+    async with WorkerSessionLocal() as session:
+        yield session
@@ -7,6 +7,7 @@ using various LLM providers.
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import Iterable
 from dataclasses import dataclass
 
 
@@ -72,7 +73,7 @@ class GenerationStrategy(ABC):
     @abstractmethod
     async def generate(
         self,
-        source_texts: list[str],
+        source_texts: Iterable[str],
         document_type: str = "notes",
         model: str | None = None,
         **options,
@@ -81,7 +82,8 @@ class GenerationStrategy(ABC):
         Generate a document from source texts.
 
         Args:
-            source_texts: List of processed source texts
+            source_texts: Processed source texts; may be a lazy iterable, so
+                consume it only once
             document_type: Type of document to generate (notes, summary, article, etc.)
             model: Specific model to use (defaults to provider's default)
             **options: Provider-specific options (temperature, max_tokens, etc.)
@@ -5,6 +5,7 @@ Generates structured documents from source texts using Mistral's LLM API.
 """
 from __future__ import annotations
 
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
 from typing import Any
 
@@ -72,7 +73,7 @@ class MistralGenerator(GenerationStrategy):
 
     async def generate(
         self,
-        source_texts: list[str],
+        source_texts: Iterable[str],
         document_type: str = "notes",
         model: str | None = None,
         **options,
@@ -81,7 +82,7 @@ class MistralGenerator(GenerationStrategy):
         Generate structured markdown document from source texts.
 
         Args:
-            source_texts: List of processed texts from sources
+            source_texts: Processed texts from sources (consumed once, lazily)
             document_type: Type of document (currently only "notes" supported)
             model: Model to use (defaults to mistral-medium-latest)
             **options: metadata (dict) - Document metadata
@@ -89,11 +90,19 @@ class MistralGenerator(GenerationStrategy):
         Returns:
             GenerationResult with markdown content
         """
-        if not source_texts:
-            return GenerationResult(success=False, error="No source texts provided")
+        source_count = 0
 
-        # Combine all source texts
-        combined_text = "\n\n".join(source_texts)
+        def counted() -> Iterator[str]:
+            nonlocal source_count
+            for text in source_texts:
+                source_count += 1
+                yield text
+
+        # Combine all source texts (only the joined string is ever fully built)
+        combined_text = "\n\n".join(counted())
+
+        if not source_count:
+            return GenerationResult(success=False, error="No source texts provided")
 
         if not combined_text.strip():
             return GenerationResult(success=False, error="All source texts are empty")
@@ -112,7 +121,7 @@ class MistralGenerator(GenerationStrategy):
                     "provider": "mistral",
                     "model": model or self.default_model(),
                     "document_type": document_type,
-                    "source_count": len(source_texts),
+                    "source_count": source_count,
                 },
             )
 
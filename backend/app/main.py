@@ -15,7 +15,10 @@ from slowapi.util import get_remote_address
 from app.api.routes import auth as auth_routes, projects as project_routes, chat as chat_routes, project_chat as project_chat_routes, admin as admin_routes
 from app.core.settings import settings
 from app.db.init_db import init_db
-from app.utils.cleanup import cleanup_temp_files
+from app.db.session import worker_engine
+from app.processors.youtube import close_http_client as close_youtube_http_client
+from app.utils.cleanup import cleanup_temp_files_async
+from app.workers import generation_queue, processing_queue
 
 # Configure logging
 logging.basicConfig(
@@ -38,14 +41,18 @@ async def lifespan(app: FastAPI):
     # Cleanup old temporary files
     temp_dir = Path("./tmp/mistral")
     if temp_dir.exists():
-        deleted = cleanup_temp_files(temp_dir, max_age_hours=24)
+        deleted = await cleanup_temp_files_async(temp_dir, max_age_hours=24)
         if deleted > 0:
             logger.info("Cleaned up temporary files", extra={"deleted": deleted})
     
     yield
     
-    # Shutdown (if needed in the future)
+    # Shutdown
     logger.info("Shutting down Champollion API")
+    await processing_queue.stop()
+    await generation_queue.stop()
+    await worker_engine.dispose()
+    await close_youtube_http_client()
 
 
 app = FastAPI(title=settings.app_name, lifespan=lifespan)
@@ -1,8 +1,8 @@
 from __future__ import annotations
 
-from datetime import UTC, datetime
+from datetime import datetime
 
-from sqlalchemy import DateTime, Enum as SAEnum, ForeignKey, Integer, Text, UniqueConstraint
+from sqlalchemy import DateTime, Enum as SAEnum, ForeignKey, Integer, Text, UniqueConstraint, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .base import Base
@@ -21,6 +21,8 @@ class ProcessingJob(Base):
     """
     __tablename__ = "processing_job"
     __table_args__ = (UniqueConstraint("project_id", name="uq_processing_job_project"),)
+    # Fetch server-generated updated_at via RETURNING instead of lazy-loading it
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     project_id: Mapped[int] = mapped_column(ForeignKey("project.id", ondelete="CASCADE"), nullable=False, index=True)
@@ -28,7 +30,8 @@ class ProcessingJob(Base):
     # add job_type field (ProcessingJobType) to track per-source jobs independently.
     status: Mapped[JobStatus] = mapped_column(SAEnum(JobStatus, name="processing_job_status", native_enum=False), nullable=False, default=JobStatus.PENDING)
     error: Mapped[str | None] = mapped_column(Text, nullable=True)
-    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=lambda: datetime.now(tz=UTC))
+    # Set by the database on insert and on every UPDATE
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now())
 
     project = relationship("Project", back_populates="processing_job")
 
@@ -42,12 +45,15 @@ class GenerationJob(Base):
     """
     __tablename__ = "generation_job"
     __table_args__ = (UniqueConstraint("project_id", name="uq_generation_job_project"),)
+    # Fetch server-generated updated_at via RETURNING instead of lazy-loading it
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     project_id: Mapped[int] = mapped_column(ForeignKey("project.id", ondelete="CASCADE"), nullable=False, index=True)
     status: Mapped[JobStatus] = mapped_column(SAEnum(JobStatus, name="generation_job_status", native_enum=False), nullable=False, default=JobStatus.PENDING)
     error: Mapped[str | None] = mapped_column(Text, nullable=True)
-    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=lambda: datetime.now(tz=UTC))
+    # Set by the database on insert and on every UPDATE
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now())
 
     project = relationship("Project", back_populates="generation_job")
 
@@ -38,6 +38,10 @@ class AudioMetadata(BaseModel):
         None,
         description="Audio file format (e.g., 'mp3', 'wav', 'ogg')"
     )
+    mime_type: Optional[str] = Field(
+        None,
+        description="MIME type resolved at upload (e.g., 'audio/mpeg')"
+    )
     bitrate: Optional[int] = Field(
         None,
         description="Audio bitrate in kbps",
@@ -53,6 +57,7 @@ class AudioMetadata(BaseModel):
                 "channels": 2,
                 "size_bytes": 2048000,
                 "format": "mp3",
+                "mime_type": "audio/mpeg",
                 "bitrate": 128
             }
         }
@@ -1,13 +1,14 @@
 from __future__ import annotations
 
+import hashlib
 from datetime import UTC, datetime
 from enum import Enum
 from typing import Optional
 
-from sqlalchemy import DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, Text, text
 from sqlalchemy.dialects.postgresql import JSON as PGJSON
 from sqlalchemy.types import JSON
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.orm import Mapped, mapped_column, relationship, validates
 
 from .base import Base
 from .enums import SourceStatus
@@ -39,12 +40,30 @@ class SourceType(str, Enum):
     PDF = "pdf"
 
 
+def compute_content_hash(text_value: str | None) -> str | None:
+    """SHA-256 hex digest of a source's text, or None when it has none."""
+    if not text_value:
+        return None
+    return hashlib.sha256(text_value.encode()).hexdigest()
+
+
 class Source(Base):
     """
     Unified model representing any content source (audio, documents, etc.)
     that can be used for note generation.
     """
     __tablename__ = "source"
+    __table_args__ = (
+        # Sources still awaiting transcription/OCR, looked up by processing
+        # jobs. The predicate must stay identical to
+        # ProjectService._pending_processing_filter for the planner to use it.
+        Index(
+            "ix_source_pending",
+            "project_id",
+            postgresql_where=text("processed_content IS NULL OR processed_content = ''"),
+            sqlite_where=text("processed_content IS NULL OR processed_content = ''"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     project_id: Mapped[int] = mapped_column(
@@ -74,6 +93,10 @@ class Source(Base):
     # Token count for the processed content (cached for performance)
     token_count: Mapped[int | None] = mapped_column(Integer, nullable=True)
 
+    # SHA-256 of the indexed text (processed_content, else content), kept in
+    # sync by the validator below; lets RAG indexing skip unchanged sources
+    content_hash: Mapped[str | None] = mapped_column(String(64), nullable=True)
+
     # Structured metadata: JSON storage for type-safe metadata handling
     # Contains AudioMetadata or DocumentMetadata depending on source type
     source_metadata: Mapped[dict | None] = mapped_column(
@@ -98,6 +121,15 @@ class Source(Base):
         back_populates="sources"
     )
 
+    @validates("content", "processed_content")
+    def _sync_content_hash(self, key: str, value: str | None) -> str | None:
+        if key == "processed_content":
+            text_value = value or self.content
+        else:
+            text_value = self.processed_content or value
+        self.content_hash = compute_content_hash(text_value)
+        return value
+
     # Type-safe metadata accessors
     @property
     def audio_metadata(self) -> Optional[AudioMetadata]:
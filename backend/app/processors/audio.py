@@ -57,6 +57,19 @@ class MistralAudioProcessor(SourceProcessor):
     def __init__(self, config: MistralAudioConfig):
         self.config = config
         self.api_key = config.get_api_key()
+        self._http_client: httpx.AsyncClient | None = None
+
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """HTTP client shared by every request this processor makes."""
+        if self._http_client is None:
+            self._http_client = httpx.AsyncClient(timeout=600.0)
+        return self._http_client
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client."""
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
 
     @classmethod
     def supported_formats(cls) -> list[str]:
@@ -165,32 +178,32 @@ class MistralAudioProcessor(SourceProcessor):
         try:
             try:
                 # Send multipart/form-data directly to Mistral API
-                async with httpx.AsyncClient(timeout=600.0) as http_client:
-                    headers = {
-                        "Authorization": f"Bearer {self.api_key}",
-                        # Do NOT set Content-Type here; httpx will set correct multipart boundary
-                    }
+                http_client = self._get_http_client()
+                headers = {
+                    "Authorization": f"Bearer {self.api_key}",
+                    # Do NOT set Content-Type here; httpx will set correct multipart boundary
+                }
 
-                    data = {
-                        "model": MISTRAL_STT_MODEL,
-                        "timestamp_granularities": "segment",
+                data = {
+                    "model": MISTRAL_STT_MODEL,
+                    "timestamp_granularities": "segment",
+                }
+                if language:
+                    data["language"] = language
+
+                with temp_wav.open("rb") as f:
+                    files = {
+                        "file": (temp_wav.name, f, "audio/wav"),
                     }
-                    if language:
-                        data["language"] = language
-
-                    with temp_wav.open("rb") as f:
-                        files = {
-                            "file": (temp_wav.name, f, "audio/wav"),
-                        }
-                        response = await http_client.post(
-                            "https://api.mistral.ai/v1/audio/transcriptions",
-                            data=data,
-                            files=files,
-                            headers=headers,
-                        )
-
-                    response.raise_for_status()
-                    transcription = response.json()
+                    response = await http_client.post(
+                        "https://api.mistral.ai/v1/audio/transcriptions",
+                        data=data,
+                        files=files,
+                        headers=headers,
+                    )
+
+                response.raise_for_status()
+                transcription = response.json()
 
             except httpx.HTTPStatusError as exc:
                 if exc.response.status_code == 401:
@@ -96,3 +96,10 @@ class SourceProcessor(ABC):
         """
         pass
 
+    async def aclose(self) -> None:
+        """
+        Release resources held across process() calls (e.g. HTTP clients).
+
+        Callers that reuse one processor instance for several sources
+        must call this once they are done. Default is a no-op.
+        """
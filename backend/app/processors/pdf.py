@@ -57,6 +57,19 @@ class MistralPDFProcessor(SourceProcessor):
     def __init__(self, config: MistralPDFConfig):
         self.config = config
         self.api_key = config.get_api_key()
+        self._http_client: httpx.AsyncClient | None = None
+
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """HTTP client shared by every request this processor makes."""
+        if self._http_client is None:
+            self._http_client = httpx.AsyncClient(timeout=120.0)
+        return self._http_client
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client."""
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
 
     @classmethod
     def supported_formats(cls) -> list[str]:
@@ -162,28 +175,28 @@ class MistralPDFProcessor(SourceProcessor):
         """
         result = None
         try:
-            async with httpx.AsyncClient(timeout=120.0) as http_client:
-                headers = {
-                    "Authorization": f"Bearer {self.api_key}",
-                    "Content-Type": "application/json",
-                }
-
-                payload = {
-                    "model": MISTRAL_OCR_MODEL,
-                    "document": {
-                        "type": "document_url",
-                        "document_url": f"data:application/pdf;base64,{pdf_base64}"
-                    }
+            http_client = self._get_http_client()
+            headers = {
+                "Authorization": f"Bearer {self.api_key}",
+                "Content-Type": "application/json",
+            }
+
+            payload = {
+                "model": MISTRAL_OCR_MODEL,
+                "document": {
+                    "type": "document_url",
+                    "document_url": f"data:application/pdf;base64,{pdf_base64}"
                 }
+            }
 
-                response = await http_client.post(
-                    "https://api.mistral.ai/v1/ocr",
-                    json=payload,
-                    headers=headers,
-                )
+            response = await http_client.post(
+                "https://api.mistral.ai/v1/ocr",
+                json=payload,
+                headers=headers,
+            )
 
-                response.raise_for_status()
-                result = response.json()
+            response.raise_for_status()
+            result = response.json()
 
         except httpx.HTTPStatusError as exc:
             if exc.response.status_code == 401:
@@ -6,14 +6,64 @@ No API key required - uses public transcript data.
 """
 from __future__ import annotations
 
+import asyncio
 import re
 from dataclasses import dataclass
 from pathlib import Path
 
+import httpx
+
 from app.processors.base import ProcessorResult, SourceProcessor
 from app.core.settings import settings
 
 
+OEMBED_URL = "https://www.youtube.com/oembed"
+
+# Shared across requests so title lookups reuse pooled connections
+_http_client: httpx.AsyncClient | None = None
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    """Get or create the shared oEmbed HTTP client."""
+    global _http_client
+    if _http_client is None:
+        _http_client = httpx.AsyncClient(
+            timeout=10.0,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=50),
+        )
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared oEmbed HTTP client (called on app shutdown)."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
+async def fetch_video_title(video_id: str) -> str | None:
+    """
+    Fetch a video title via the oEmbed API (no API key required).
+
+    Args:
+        video_id: YouTube video ID
+
+    Returns:
+        Video title, or None if the lookup fails for any reason
+    """
+    try:
+        response = await _get_http_client().get(
+            OEMBED_URL,
+            params={"url": f"https://www.youtube.com/watch?v={video_id}", "format": "json"},
+        )
+        if response.status_code == 200:
+            return response.json().get("title")
+    except Exception:
+        pass
+    return None
+
+
 @dataclass
 class YouTubeProcessorConfig:
     """Configuration for YouTube transcript processor."""
@@ -138,6 +188,15 @@ class YouTubeProcessor(SourceProcessor):
             "preferred_languages", self.config.preferred_languages
         ) or ["fr", "en"]
 
+        # youtube-transcript-api is blocking; keep it off the event loop
+        return await asyncio.to_thread(
+            self._fetch_transcript, video_id, preferred_languages
+        )
+
+    def _fetch_transcript(
+        self, video_id: str, preferred_languages: list[str]
+    ) -> ProcessorResult:
+        """Fetch a transcript synchronously (run in a worker thread)."""
         try:
             # Import here to avoid import errors if package not installed
             from youtube_transcript_api import YouTubeTranscriptApi
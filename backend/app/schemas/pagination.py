@@ -29,6 +29,24 @@ class PaginationParams(BaseModel):
     )
 
 
+class CursorPaginationParams(BaseModel):
+    """
+    Query parameters for cursor (keyset) paginated endpoints.
+
+    Used as FastAPI dependency to parse cursor/limit from query string.
+    """
+    cursor: str | None = Field(
+        default=None,
+        description="Opaque cursor from the previous page's next_cursor (omit for the first page)"
+    )
+    limit: int = Field(
+        default=20,
+        ge=1,
+        le=100,
+        description="Number of items to return (1-100)"
+    )
+
+
 class PaginatedResponse(BaseModel, Generic[T]):
     """
     Generic paginated response wrapper.
@@ -76,3 +94,25 @@ class PaginatedResponse(BaseModel, Generic[T]):
             offset=offset,
             has_more=(offset + len(items)) < total
         )
+
+
+class CursorPaginatedResponse(BaseModel, Generic[T]):
+    """
+    Paginated response for cursor (keyset) pagination.
+
+    Pages are fetched by passing next_cursor back; no total is computed.
+    """
+    items: list[T] = Field(
+        description="List of items for current page"
+    )
+    limit: int = Field(
+        ge=1,
+        description="Number of items requested per page"
+    )
+    next_cursor: str | None = Field(
+        default=None,
+        description="Cursor for the next page, null on the last page"
+    )
+    has_more: bool = Field(
+        description="Whether more items exist beyond current page"
+    )
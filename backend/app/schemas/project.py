@@ -71,7 +71,9 @@ class ProjectSummary(BaseModel):
     processing_status: JobStatusRead | None = None
     document_status: JobStatusRead | None = None
 
-    model_config = ConfigDict(from_attributes=True)
+    # Frozen: the service caches summaries and hands the same instance to
+    # every request that lists an unchanged project
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
     @computed_field
     @property
@@ -126,7 +128,8 @@ class ProjectDetail(ProjectSummary):
     processing_status: JobStatusRead | None = None
     document_status: JobStatusRead | None = None
 
-    model_config = ConfigDict(from_attributes=True)
+    # Built per request and never cached: stays mutable unlike ProjectSummary
+    model_config = ConfigDict(from_attributes=True, frozen=False)
 
     @computed_field
     @property
@@ -168,7 +171,8 @@ class JobStatusRead(BaseModel):
     updated_at: datetime
     error: str | None = None
 
-    model_config = ConfigDict(from_attributes=True)
+    # Frozen: shared by cached ProjectSummary instances
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class TokenEstimation(BaseModel):
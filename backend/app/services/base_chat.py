@@ -24,6 +24,8 @@ logger = logging.getLogger(__name__)
 # Constants
 CHAT_MODEL = "mistral-large-latest"
 MAX_HISTORY_MESSAGES = 10
+EVENT_PREFIX = "[EVENT:"
+SEARCH_COMPLETE_EVENT = "[EVENT:search_complete:"
 
 # Tool definitions for Mistral function calling
 TOOLS = [
@@ -128,7 +130,7 @@ class BaseChatService(ABC):
 
                         logger.debug("RAG response: %d chunks found", len(chunks_preview))
 
-                        yield f'[EVENT:search_complete:{json.dumps({"sources": source_titles, "chunks": chunks_preview})}]'
+                        yield f'{SEARCH_COMPLETE_EVENT}{json.dumps({"sources": source_titles, "chunks": chunks_preview})}]'
 
                         messages.append({
                             "role": "assistant",
@@ -170,6 +172,24 @@ class BaseChatService(ABC):
 
         yield "[Réponse interrompue - trop d'itérations]"
 
+    @staticmethod
+    def parse_search_complete(chunk: str) -> dict | None:
+        """Decode the payload of a search_complete event.
+        
+        Args:
+            chunk: Streamed chunk starting with SEARCH_COMPLETE_EVENT
+            
+        Returns:
+            Event payload, or None if the event is malformed
+        """
+        if not chunk.endswith("]"):
+            return None
+        try:
+            payload = json.loads(chunk[len(SEARCH_COMPLETE_EVENT):-1])
+        except ValueError:
+            return None
+        return payload if isinstance(payload, dict) else None
+
     @staticmethod
     def clean_response(response: str) -> str:
         """Remove event markers from response text."""
@@ -7,12 +7,12 @@ of job models (ProcessingJob, GenerationJob, etc.), following DRY principles.
 from __future__ import annotations
 
 import logging
-from datetime import UTC, datetime
-from typing import Generic, TypeVar
+from typing import Any, Generic, TypeVar
 
-from sqlalchemy import select
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload
 
 from app.models import JobStatus, Project
 
@@ -21,6 +21,12 @@ logger = logging.getLogger(__name__)
 # Generic type variable for job models
 TJob = TypeVar("TJob")
 
+# Dialects whose INSERT supports ON CONFLICT DO UPDATE ... RETURNING
+_UPSERT_INSERTS = {
+    "postgresql": postgresql.insert,
+    "sqlite": sqlite.insert,
+}
+
 
 class BaseJobService(Generic[TJob]):
     """
@@ -83,6 +89,11 @@ class BaseJobService(Generic[TJob]):
         Returns:
             Existing or newly created job
         """
+        # No-op update: RETURNING yields the existing row on conflict
+        job = await self._upsert_job(project_id, {"project_id": project_id})
+        if job is not None:
+            return job
+
         job = await self.get_job_by_project(project_id)
         if job:
             return job
@@ -92,6 +103,28 @@ class BaseJobService(Generic[TJob]):
         await self.session.flush()
         return job
 
+    async def start_project_job(self, project_id: int, status: JobStatus) -> TJob:
+        """
+        Get or create the project's job and set its status in one statement.
+
+        Used at job start, where get_or_create_job + mark_* would otherwise
+        cost two round-trips.
+
+        Args:
+            project_id: ID of the project
+            status: Status to set (error is cleared)
+
+        Returns:
+            Updated job
+        """
+        values = {"status": status, "error": None, "updated_at": func.now()}
+        job = await self._upsert_job(project_id, values)
+        if job is not None:
+            return job
+
+        job = await self.get_or_create_job(project_id)
+        return await self._update_job(job.id, status=status, error=None)
+
     async def mark_in_progress(self, job_id: int) -> TJob:
         """
         Mark a job as in progress.
@@ -105,15 +138,9 @@ class BaseJobService(Generic[TJob]):
         Raises:
             ValueError: If job not found
         """
-        job = await self.get_job(job_id)
-        if not job:
-            raise ValueError(f"{self.job_name} {job_id} not found")
-
-        job.status = JobStatus.IN_PROGRESS
-        job.error = None
-        job.updated_at = datetime.now(tz=UTC)
-        await self.session.flush()
-        return job
+        return await self._update_job(
+            job_id, status=JobStatus.IN_PROGRESS, error=None
+        )
 
     async def mark_succeeded(self, job_id: int) -> TJob:
         """
@@ -128,15 +155,9 @@ class BaseJobService(Generic[TJob]):
         Raises:
             ValueError: If job not found
         """
-        job = await self.get_job(job_id)
-        if not job:
-            raise ValueError(f"{self.job_name} {job_id} not found")
-
-        job.status = JobStatus.SUCCEEDED
-        job.error = None
-        job.updated_at = datetime.now(tz=UTC)
-        await self.session.flush()
-        return job
+        return await self._update_job(
+            job_id, status=JobStatus.SUCCEEDED, error=None
+        )
 
     async def mark_failed(self, job_id: int, error_message: str) -> TJob:
         """
@@ -152,15 +173,9 @@ class BaseJobService(Generic[TJob]):
         Raises:
             ValueError: If job not found
         """
-        job = await self.get_job(job_id)
-        if not job:
-            raise ValueError(f"{self.job_name} {job_id} not found")
-
-        job.status = JobStatus.FAILED
-        job.error = self._truncate_error(error_message)
-        job.updated_at = datetime.now(tz=UTC)
-        await self.session.flush()
-        return job
+        return await self._update_job(
+            job_id, status=JobStatus.FAILED, error=self._truncate_error(error_message)
+        )
 
     async def get_project(self, job_id: int) -> Project | None:
         """
@@ -172,13 +187,11 @@ class BaseJobService(Generic[TJob]):
         Returns:
             Project if found, None otherwise
         """
-        job = await self.get_job(job_id)
-        if not job:
-            return None
-
         result = await self.session.execute(
-            select(Project).where(Project.id == job.project_id)
-                .options(selectinload(Project.owner))
+            select(Project)
+                .join(self.model_class, self.model_class.project_id == Project.id)
+                .where(self.model_class.id == job_id)
+                .options(joinedload(Project.owner))
         )
         return result.scalars().first()
 
@@ -192,13 +205,69 @@ class BaseJobService(Generic[TJob]):
         Returns:
             True if deleted, False if not found
         """
-        job = await self.get_job(job_id)
-        if not job:
-            return False
+        result = await self.session.execute(
+            delete(self.model_class)
+                .where(self.model_class.id == job_id)
+                .returning(self.model_class.id)
+        )
+        return result.scalar_one_or_none() is not None
 
-        await self.session.delete(job)
-        await self.session.flush()
-        return True
+    async def _upsert_job(self, project_id: int, on_conflict: dict[str, Any]) -> TJob | None:
+        """
+        INSERT the project's job, or UPDATE it with `on_conflict` if it exists.
+
+        Relies on the unique constraint on project_id. Single round-trip,
+        and safe against concurrent workers creating the same job.
+
+        Args:
+            project_id: ID of the project
+            on_conflict: Column values to set when the job already exists
+
+        Returns:
+            The inserted or updated job, or None if the database dialect
+            has no ON CONFLICT support (caller falls back to SELECT/INSERT)
+        """
+        dialect_insert = _UPSERT_INSERTS.get(self.session.get_bind().dialect.name)
+        if dialect_insert is None:
+            return None
+
+        insert_values = {key: value for key, value in on_conflict.items() if key != "project_id"}
+        stmt = dialect_insert(self.model_class).values(project_id=project_id, **insert_values)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[self.model_class.project_id],
+            set_=on_conflict,
+        ).returning(self.model_class)
+        result = await self.session.execute(
+            stmt, execution_options={"populate_existing": True}
+        )
+        return result.scalar_one()
+
+    async def _update_job(self, job_id: int, **values: Any) -> TJob:
+        """
+        Update a job's columns in a single UPDATE ... RETURNING statement.
+
+        Args:
+            job_id: ID of the job
+            **values: Column values to set (updated_at is refreshed by the
+                column's onupdate)
+
+        Returns:
+            Updated job
+
+        Raises:
+            ValueError: If job not found
+        """
+        result = await self.session.execute(
+            update(self.model_class)
+                .where(self.model_class.id == job_id)
+                .values(**values)
+                .returning(self.model_class),
+            execution_options={"populate_existing": True},
+        )
+        job = result.scalars().first()
+        if not job:
+            raise ValueError(f"{self.job_name} {job_id} not found")
+        return job
 
     @staticmethod
     def _truncate_error(message: str, length: int = 512) -> str:
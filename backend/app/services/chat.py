@@ -6,7 +6,6 @@ Inherits common agentic loop logic from BaseChatService.
 
 from __future__ import annotations
 
-import json
 import logging
 from datetime import UTC, datetime
 from typing import AsyncIterator, Any
@@ -16,7 +15,12 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from app.models import ChatMessage, Document, User
-from app.services.base_chat import BaseChatService, MAX_HISTORY_MESSAGES
+from app.services.base_chat import (
+    EVENT_PREFIX,
+    MAX_HISTORY_MESSAGES,
+    SEARCH_COMPLETE_EVENT,
+    BaseChatService,
+)
 from app.services.embedding import EmbeddingService
 
 logger = logging.getLogger(__name__)
@@ -63,14 +67,25 @@ class ChatService(BaseChatService):
 
         return document
 
-    async def get_history(self, document_id: int) -> list[ChatMessage]:
-        """Get conversation history for a document."""
-        result = await self.session.execute(
-            select(ChatMessage)
-            .where(ChatMessage.document_id == document_id)
-            .order_by(ChatMessage.created_at.asc())
-        )
-        return list(result.scalars().all())
+    async def get_history(self, document_id: int, limit: int | None = None) -> list[ChatMessage]:
+        """Get conversation history for a document, oldest first.
+
+        Args:
+            document_id: ID of the document
+            limit: Only return the most recent `limit` messages
+
+        Returns:
+            Messages in chronological order
+        """
+        stmt = select(ChatMessage).where(ChatMessage.document_id == document_id)
+        if limit is None:
+            stmt = stmt.order_by(ChatMessage.created_at.asc(), ChatMessage.id.asc())
+            result = await self.session.execute(stmt)
+            return list(result.scalars().all())
+
+        stmt = stmt.order_by(ChatMessage.created_at.desc(), ChatMessage.id.desc()).limit(limit)
+        result = await self.session.execute(stmt)
+        return list(reversed(result.scalars().all()))
 
     async def clear_history(self, document_id: int) -> None:
         """Clear conversation history for a document."""
@@ -101,6 +116,9 @@ class ChatService(BaseChatService):
         if not get_effective_api_key_sync(self.user):
             raise ValueError("API key not configured and no active demo access")
 
+        # Get recent history before saving the new message, so it's excluded
+        history = await self.get_history(document_id, limit=MAX_HISTORY_MESSAGES)
+
         # Save user message
         user_msg = ChatMessage(
             document_id=document_id,
@@ -112,8 +130,8 @@ class ChatService(BaseChatService):
             } if action or selected_text else None,
             created_at=datetime.now(tz=UTC)
         )
+        # Inserted together with the assistant reply at the final commit
         self.session.add(user_msg)
-        await self.session.flush()
 
         # Index sources for RAG
         sources = list(document.sources)
@@ -121,32 +139,26 @@ class ChatService(BaseChatService):
             embedding_svc = self._get_embedding_service()
             await embedding_svc.index_sources(document_id, sources)
 
-        # Get recent history
-        history = await self.get_history(document_id)
-        history = [h for h in history if h.id != user_msg.id][-MAX_HISTORY_MESSAGES:]
-
         # Build messages for Mistral
         messages = self._build_messages(document, history, message, action, selected_text)
 
         # Agentic loop - capture sources for saving
-        full_response = ""
+        response_parts: list[str] = []
         sources_used: list[str] = []
         chunks_found: list[dict] = []
         
         async for chunk in self._agentic_loop(document_id, messages):
-            if chunk.startswith("[EVENT:search_complete:"):
-                try:
-                    payload_str = chunk[23:-1]
-                    payload = json.loads(payload_str)
+            if not chunk.startswith(EVENT_PREFIX):
+                # Text token, the common case: a single prefix check
+                response_parts.append(chunk)
+            elif chunk.startswith(SEARCH_COMPLETE_EVENT):
+                payload = self.parse_search_complete(chunk)
+                if payload is not None:
                     sources_used = payload.get("sources", [])
                     chunks_found = payload.get("chunks", [])
-                except Exception:
-                    pass
-            elif not chunk.startswith("[EVENT:"):
-                full_response += chunk
             yield chunk
 
-        clean_response = self.clean_response(full_response)
+        clean_response = self.clean_response("".join(response_parts))
 
         # Save assistant response
         assistant_metadata = None
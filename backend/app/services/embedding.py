@@ -5,16 +5,27 @@ Provides semantic search capabilities using Mistral embeddings and ChromaDB.
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import logging
-from dataclasses import dataclass
+import re
+import time
+from array import array
+from collections import OrderedDict, deque
+from collections.abc import AsyncIterator, Iterable
+from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import TYPE_CHECKING
+from uuid import uuid4
 
 import chromadb
+import numpy as np
 from mistralai import Mistral
 
 from mistralai.models.sdkerror import SDKError
 from app.core.security import decrypt_api_key
+from app.core.settings import settings
+from app.models.source import compute_content_hash
 
 if TYPE_CHECKING:
     from app.models import Source, User
@@ -25,6 +36,18 @@ logger = logging.getLogger(__name__)
 EMBEDDING_MODEL = "mistral-embed"
 CHUNK_SIZE = 150  # ~150 words per chunk for focused semantic signal
 CHUNK_OVERLAP = 30  # 30% overlap between chunks
+EMBED_BATCH_SIZE = 64  # Chunks per embeddings request
+EMBED_CONCURRENCY = 4  # Embeddings requests in flight while indexing
+_WORD_RE = re.compile(r"\w+")
+_QUOTED_RE = re.compile(r'^\s*["«“]\s*([^"«»“”]+?)\s*["»”]\s*$')
+MIN_SEMANTIC_QUERY_LENGTH = 3  # Shorter queries carry no semantic signal
+QUERY_CACHE_SIZE = 128  # Semantic search results remembered per collection
+ANCHOR_CACHE_SIZE = 256  # Keyword candidate lists remembered per collection
+QUERY_EMBEDDING_CACHE_SIZE = 512  # Query vectors kept process-wide
+MAX_INDEXED_COLLECTIONS = 64  # Project/document indexes kept in memory
+# Minimum cosine similarity for a semantic hit. Equivalent to the former
+# "1 - L2 distance >= 0.5" cut-off on mistral-embed's unit-norm vectors.
+MIN_SIMILARITY = 0.75
 
 
 @dataclass
@@ -37,6 +60,129 @@ class ChunkResult:
     score: float
 
 
+def _normalize(vector: list[float]) -> np.ndarray:
+    """Scale a vector to unit length so dot products are cosine similarities."""
+    unit = np.asarray(vector, dtype=np.float32)
+    norm = np.linalg.norm(unit)
+    return unit / norm if norm else unit
+
+
+@dataclass
+class IndexedCollection:
+    """ChromaDB collection plus the in-memory chunk buffer used for keyword search.
+    
+    Chunks are kept alongside the collection (already lowercased) so the
+    keyword pass never has to pull every document back out of ChromaDB, and
+    an inverted index (word -> chunk positions) narrows it to candidates.
+    Recent semantic searches are cached with the collection (for
+    `settings.rag_query_cache_ttl_seconds`), so re-indexing drops them along
+    with the old chunks.
+    """
+    
+    collection: chromadb.Collection
+    source_hash: str
+    # source id -> content hash of what was embedded
+    source_hashes: dict[int, str] = field(default_factory=dict)
+    documents: list[str] = field(default_factory=list)
+    lowered: list[str] = field(default_factory=list)
+    metadatas: list[dict] = field(default_factory=list)
+    postings: dict[str, set[int]] = field(default_factory=dict)
+    # anchor word -> sorted positions of chunks with a word containing it
+    anchor_candidates: dict[str, list[int]] = field(default_factory=dict)
+    # (top_k, normalized query) -> (expiry on the monotonic clock,
+    # unit-length query embedding, results)
+    query_cache: OrderedDict[tuple[int, str], tuple[float, np.ndarray, list[ChunkResult]]] = field(
+        default_factory=OrderedDict
+    )
+    
+    def build_postings(self) -> None:
+        """Index every lowercased chunk by the words it contains."""
+        postings: dict[str, set[int]] = {}
+        for i, doc in enumerate(self.lowered):
+            for word in _WORD_RE.findall(doc):
+                postings.setdefault(word, set()).add(i)
+        self.postings = postings
+        self.anchor_candidates = {}
+    
+    def keyword_hits(self, query_lower: str) -> list[int]:
+        """Positions of chunks containing query_lower, in collection order.
+        
+        Any substring match puts the query's longest word inside one of the
+        chunk's words, so candidates come from the postings of vocabulary
+        words containing it; substring containment is then verified on those
+        candidates only. The vocabulary scan is remembered per anchor word
+        (postings don't change after indexing), so repeated searches skip it.
+        
+        Args:
+            query_lower: Lowercased search query
+            
+        Returns:
+            Sorted chunk positions whose text contains the query
+        """
+        words = _WORD_RE.findall(query_lower)
+        if not words:
+            candidates: Iterable[int] = range(len(self.lowered))
+        else:
+            anchor = max(words, key=len)
+            candidates = self.anchor_candidates.get(anchor)
+            if candidates is None:
+                matched: set[int] = set()
+                for word, positions in self.postings.items():
+                    if anchor in word:
+                        matched |= positions
+                candidates = sorted(matched)
+                if len(self.anchor_candidates) < ANCHOR_CACHE_SIZE:
+                    self.anchor_candidates[anchor] = candidates
+        return [i for i in candidates if query_lower in self.lowered[i]]
+    
+    def cached_results(self, key: tuple[int, str]) -> list[ChunkResult] | None:
+        """Results of an earlier semantic search for the exact same query and top_k."""
+        entry = self.query_cache.get(key)
+        if entry is None:
+            return None
+        if entry[0] < time.monotonic():
+            del self.query_cache[key]
+            return None
+        self.query_cache.move_to_end(key)
+        return list(entry[2])
+    
+    def similar_results(self, embedding: list[float], top_k: int) -> list[ChunkResult] | None:
+        """Results of the closest cached query, if it is a near-paraphrase.
+        
+        Args:
+            embedding: Embedding of the new query
+            top_k: Number of results requested; only searches made with the
+                same top_k are reused
+            
+        Returns:
+            Cached results when cosine similarity reaches
+            `settings.rag_query_cache_min_similarity`
+        """
+        if not self.query_cache:
+            return None
+        keys = list(self.query_cache)
+        entries = list(self.query_cache.values())
+        # One matrix-vector product instead of a Python loop per cached query
+        sims = np.stack([entry[1] for entry in entries]) @ _normalize(embedding)
+        expires_at = np.fromiter((entry[0] for entry in entries), float, len(entries))
+        sims[expires_at < time.monotonic()] = -np.inf
+        sims[np.fromiter((key[0] != top_k for key in keys), bool, len(keys))] = -np.inf
+        best = int(np.argmax(sims))
+        if sims[best] < settings.rag_query_cache_min_similarity:
+            return None
+        return self.cached_results(keys[best])
+    
+    def remember_results(
+        self, key: tuple[int, str], embedding: list[float], results: list[ChunkResult]
+    ) -> None:
+        """Store semantic search results, evicting the least recently used."""
+        expires_at = time.monotonic() + settings.rag_query_cache_ttl_seconds
+        self.query_cache[key] = (expires_at, _normalize(embedding), list(results))
+        self.query_cache.move_to_end(key)
+        while len(self.query_cache) > QUERY_CACHE_SIZE:
+            self.query_cache.popitem(last=False)
+    
+
 def _chunk_text(text: str, chunk_size: int = CHUNK_SIZE, overlap: int = CHUNK_OVERLAP) -> list[str]:
     """Split text into overlapping chunks.
     
@@ -63,17 +209,146 @@ def _chunk_text(text: str, chunk_size: int = CHUNK_SIZE, overlap: int = CHUNK_OV
     return chunks
 
 
-def _source_hash(sources: list["Source"]) -> str:
-    """Generate hash for a set of sources (for cache invalidation)."""
-    ids = sorted([s.id for s in sources])
-    return hashlib.md5(str(ids).encode()).hexdigest()[:12]
+@lru_cache(maxsize=256)
+def _chunk_content(content: str) -> tuple[str, ...]:
+    """Chunk a source's content, memoized on the content itself.
+    
+    Re-indexing (new chat request, project membership change) hands the same
+    processed_content back in, so unchanged sources skip re-splitting.
+    
+    Args:
+        content: Source text to chunk
+        
+    Returns:
+        Tuple of text chunks (immutable so cached values can't be mutated)
+    """
+    return tuple(_chunk_text(content))
+
+
+def _chunk_contents(contents: list[str]) -> list[tuple[str, ...]]:
+    """Chunk several sources' content in one call (run in a worker thread)."""
+    return [_chunk_content(content) for content in contents]
+
+
+def _hnsw_metadata(chunk_count: int) -> dict[str, int | str]:
+    """Pick HNSW parameters for a collection of the given size.
+    
+    Small per-document collections don't need a dense graph, large project
+    collections need more links and a wider search beam to keep recall up.
+    
+    Args:
+        chunk_count: Number of chunks that will be stored
+        
+    Returns:
+        ChromaDB collection metadata with hnsw:* keys
+    """
+    if chunk_count < 100:
+        m, construction_ef, search_ef = 8, 100, 32
+    elif chunk_count > 10_000:
+        m, construction_ef, search_ef = 32, 400, 128
+    else:
+        m, construction_ef, search_ef = 16, 200, 64
+    return {
+        "hnsw:space": "cosine",
+        "hnsw:M": m,
+        "hnsw:construction_ef": construction_ef,
+        "hnsw:search_ef": search_ef,
+    }
+
+
+# (model, blake2b(query)) -> embedding, shared by every EmbeddingService in
+# the process: the chat service (and its collections) lives for one request,
+# but users and the agent loop keep re-asking the same questions. Embeddings
+# only depend on the model, not on whose API key requested them.
+_query_embeddings: OrderedDict[tuple[str, bytes], list[float]] = OrderedDict()
+
+
+def _query_embedding_key(query: str) -> tuple[str, bytes]:
+    return EMBEDDING_MODEL, hashlib.blake2b(query.encode(), digest_size=16).digest()
+
+
+# Indexed collections, shared by every EmbeddingService in the process (one
+# is created per chat request) so unchanged sources aren't re-embedded on
+# every turn. Bounded: the least recently used collection is dropped.
+_chroma_client: chromadb.ClientAPI | None = None
+_collections: OrderedDict[str, IndexedCollection] = OrderedDict()
+_index_locks: dict[str, asyncio.Lock] = {}
+
+
+def _get_chroma_client() -> chromadb.ClientAPI:
+    """Lazy-load the process-wide in-memory ChromaDB client."""
+    global _chroma_client
+    if _chroma_client is None:
+        _chroma_client = chromadb.Client()
+    return _chroma_client
+
+
+def _get_collection(collection_name: str) -> IndexedCollection | None:
+    indexed = _collections.get(collection_name)
+    if indexed is not None:
+        _collections.move_to_end(collection_name)
+    return indexed
+
+
+def _store_collection(collection_name: str, indexed: IndexedCollection) -> None:
+    _collections[collection_name] = indexed
+    _collections.move_to_end(collection_name)
+    while len(_collections) > MAX_INDEXED_COLLECTIONS:
+        evicted_name, evicted = _collections.popitem(last=False)
+        _index_locks.pop(evicted_name, None)
+        _drop_chroma_collection(evicted.collection.name)
+
+
+def _drop_chroma_collection(chroma_name: str) -> None:
+    try:
+        _get_chroma_client().delete_collection(chroma_name)
+    except Exception:
+        pass  # Already gone
+
+
+def _project_collection_name(project_id: int, source_ids: Iterable[int] | None) -> str:
+    """Collection name for a project's sources, or for a selected subset of them.
+    
+    Chats restricted to some sources get their own collection, so they
+    never overwrite (or get overwritten by) the full project index.
+    """
+    if source_ids is None:
+        return f"project_{project_id}"
+    digest = hashlib.blake2b(array("q", sorted(set(source_ids))).tobytes(), digest_size=6)
+    return f"project_{project_id}_{digest.hexdigest()}"
+
+
+def _source_content_hash(source: "Source") -> str:
+    """Stored content hash, computed on the fly for rows indexed before the column."""
+    return (
+        source.content_hash
+        or compute_content_hash(source.processed_content or source.content)
+        or ""
+    )
+
+
+def _source_hash(content_hashes: dict[int, str], titles: dict[int, str]) -> str:
+    """Generate hash for a set of sources, their contents and titles (for cache invalidation).
+    
+    Titles are part of the stored chunk metadata, so a rename must rebuild
+    the collection even though no chunk needs re-embedding.
+    """
+    digest = hashlib.blake2b(digest_size=6)
+    for source_id in sorted(content_hashes):
+        digest.update(array("q", [source_id]).tobytes())
+        digest.update(content_hashes[source_id].encode())
+        digest.update(b"\0")
+        digest.update((titles.get(source_id) or "").encode())
+        digest.update(b"\0")
+    return digest.hexdigest()
 
 
 class EmbeddingService:
     """Service for embedding sources and performing semantic search.
     
     Uses ChromaDB in-memory for vector storage and Mistral for embeddings.
-    Embeddings are computed on-demand and cached per document session.
+    Embeddings are computed on-demand; indexed collections are shared
+    process-wide and only re-embedded for sources whose content changed.
     """
     
     def __init__(self, user: "User"):
@@ -83,8 +358,6 @@ class EmbeddingService:
             user: Current user (for API key access)
         """
         self.user = user
-        self._client = chromadb.Client()  # In-memory
-        self._collections: dict[str, chromadb.Collection] = {}
         self._mistral: Mistral | None = None
     
     def _get_mistral(self) -> Mistral:
@@ -127,6 +400,74 @@ class EmbeddingService:
             logger.error("Error getting embeddings", exc_info=exc)
             raise
     
+    async def _embed_query(self, query: str) -> list[float] | None:
+        """Embed a search query, reusing the process-wide LRU for repeats.
+        
+        Args:
+            query: Search query
+            
+        Returns:
+            Embedding vector, or None if Mistral returned nothing
+        """
+        key = _query_embedding_key(query)
+        embedding = _query_embeddings.get(key)
+        if embedding is not None:
+            _query_embeddings.move_to_end(key)
+            return embedding
+        
+        embeddings = await self._embed_texts([query])
+        if not embeddings:
+            return None
+        _query_embeddings[key] = embeddings[0]
+        while len(_query_embeddings) > QUERY_EMBEDDING_CACHE_SIZE:
+            _query_embeddings.popitem(last=False)
+        return embeddings[0]
+    
+    async def _embed_batches(
+        self,
+        chunks: list[str],
+    ) -> AsyncIterator[tuple[int, list[list[float]]]]:
+        """Embed chunks in batches of EMBED_BATCH_SIZE, up to EMBED_CONCURRENCY at once.
+        
+        Batches are requested concurrently but yielded in order, so the
+        caller can store one batch while later ones are still in flight.
+        Each distinct chunk is sent to Mistral once (boilerplate repeated
+        across sources would otherwise be billed N times); duplicates reuse
+        the vector of their first occurrence.
+        
+        Args:
+            chunks: Chunks to embed, in collection order
+            
+        Yields:
+            (start offset, embeddings for chunks[start:start + len(embeddings)])
+        """
+        vectors: dict[str, list[float]] = {}
+        requested: set[str] = set()
+        
+        def dispatch(start: int) -> tuple[list[str], asyncio.Task[list[list[float]]]]:
+            pending = list(dict.fromkeys(
+                chunk for chunk in chunks[start:start + EMBED_BATCH_SIZE]
+                if chunk not in requested
+            ))
+            requested.update(pending)
+            return pending, asyncio.create_task(self._embed_texts(pending))
+        
+        starts = range(0, len(chunks), EMBED_BATCH_SIZE)
+        in_flight: deque[tuple[list[str], asyncio.Task[list[list[float]]]]] = deque(
+            dispatch(start) for start in starts[:EMBED_CONCURRENCY]
+        )
+        try:
+            for i, start in enumerate(starts):
+                pending, task = in_flight.popleft()
+                vectors.update(zip(pending, await task))
+                if i + EMBED_CONCURRENCY < len(starts):
+                    in_flight.append(dispatch(starts[i + EMBED_CONCURRENCY]))
+                end = start + EMBED_BATCH_SIZE
+                yield start, [vectors[chunk] for chunk in chunks[start:end]]
+        finally:
+            for _, task in in_flight:
+                task.cancel()
+    
     async def index_sources(self, document_id: int, sources: list["Source"]) -> str:
         """Index sources for a document.
         
@@ -139,39 +480,69 @@ class EmbeddingService:
         Returns:
             Collection name
         """
-        collection_name = f"doc_{document_id}"
+        return await self._index_collection(
+            f"doc_{document_id}", sources, {"document_id": document_id}
+        )
+
+    async def _index_collection(
+        self,
+        collection_name: str,
+        sources: list["Source"],
+        log_extra: dict,
+    ) -> str:
+        """Chunk, embed and store sources into the named collection.
         
-        # Check if already indexed with same sources
-        source_hash = _source_hash(sources)
-        if collection_name in self._collections:
-            existing = self._collections[collection_name]
-            if existing.metadata and existing.metadata.get("source_hash") == source_hash:
-                logger.debug("Sources already indexed", extra={"document_id": document_id})
-                return collection_name
+        Shared by document-level and project-level indexing.
         
-        # Create new collection
-        try:
-            self._client.delete_collection(collection_name)
-        except Exception:
-            pass  # Collection doesn't exist
+        Args:
+            collection_name: Name of the ChromaDB collection
+            sources: List of sources to index
+            log_extra: Context added to log records (document_id or project_id)
             
-        collection = self._client.create_collection(
-            name=collection_name,
-            metadata={"source_hash": source_hash}
-        )
-
+        Returns:
+            Collection name
+        """
+        lock = _index_locks.setdefault(collection_name, asyncio.Lock())
+        async with lock:
+            await self._rebuild_collection(collection_name, sources, log_extra)
+        
+        return collection_name
+    
+    async def _rebuild_collection(
+        self,
+        collection_name: str,
+        sources: list["Source"],
+        log_extra: dict,
+    ) -> None:
+        """(Re)build a collection unless its sources and contents are unchanged.
+        
+        Chunks of sources whose content hash matches the previous index keep
+        their stored vectors; only new or edited sources are embedded.
+        
+        The new index is built under a temporary ChromaDB name and swapped
+        into the registry once complete, so concurrent searches keep using
+        the previous collection until then.
+        """
+        # Check if already indexed with same sources, contents and titles
+        content_hashes = {s.id: _source_content_hash(s) for s in sources}
+        source_hash = _source_hash(content_hashes, {s.id: s.title for s in sources})
+        previous = _get_collection(collection_name)
+        if previous is not None and previous.source_hash == source_hash:
+            logger.debug("Sources already indexed", extra=log_extra)
+            return
         
         # Prepare chunks from all sources
         all_chunks: list[str] = []
         all_ids: list[str] = []
         all_metadatas: list[dict] = []
         
-        for source in sources:
-            content = source.processed_content or source.content
-            if not content:
-                continue
-                
-            chunks = _chunk_text(content)
+        # Chunk off the event loop; large transcripts take a while to split
+        with_content = [s for s in sources if s.processed_content or s.content]
+        chunked = await asyncio.to_thread(
+            _chunk_contents, [s.processed_content or s.content for s in with_content]
+        )
+        
+        for source, chunks in zip(with_content, chunked):
             for i, chunk in enumerate(chunks):
                 all_chunks.append(chunk)
                 all_ids.append(f"{source.id}_{i}")
@@ -181,30 +552,96 @@ class EmbeddingService:
                     "chunk_index": i
                 })
         
-        if not all_chunks:
-            logger.warning("No content to index", extra={"document_id": document_id})
-            self._collections[collection_name] = collection
-            return collection_name
-        
-        # Get embeddings
-        embeddings = await self._embed_texts(all_chunks)
-        
-        # Add to collection
-        collection.add(
-            ids=all_ids,
-            embeddings=embeddings,
-            documents=all_chunks,
-            metadatas=all_metadatas
+        # Unchanged sources chunk identically: carry their vectors over
+        reused: dict[str, list[float]] = {}
+        if previous is not None:
+            unchanged = {
+                source_id for source_id, content_hash in content_hashes.items()
+                if previous.source_hashes.get(source_id) == content_hash
+            }
+            wanted = [
+                chunk_id for chunk_id, metadata in zip(all_ids, all_metadatas)
+                if metadata["source_id"] in unchanged
+            ]
+            if wanted:
+                stored = previous.collection.get(ids=wanted, include=["embeddings"])
+                reused = dict(zip(stored["ids"], stored["embeddings"]))
+        
+        # Create new collection, sized to the number of chunks, next to the
+        # live one: searches keep hitting the previous index while we embed
+        collection = _get_chroma_client().create_collection(
+            name=f"{collection_name}_{uuid4().hex[:12]}",
+            metadata={"source_hash": source_hash, **_hnsw_metadata(len(all_chunks))}
         )
+        indexed = IndexedCollection(
+            collection=collection, source_hash=source_hash, source_hashes=content_hashes
+        )
+        try:
+            kept = await self._fill_collection(
+                indexed, all_chunks, all_ids, all_metadatas, reused, log_extra
+            )
+        except BaseException:
+            # Don't leave an index whose sources no longer match behind
+            _drop_chroma_collection(collection.name)
+            stale = _collections.pop(collection_name, None)
+            if stale is not None:
+                _drop_chroma_collection(stale.collection.name)
+            raise
         
-        self._collections[collection_name] = collection
-        logger.info("Indexed sources", extra={
-            "document_id": document_id,
-            "chunk_count": len(all_chunks),
-            "source_count": len(sources)
-        })
+        _store_collection(collection_name, indexed)
+        if previous is not None and previous.collection.name != collection.name:
+            _drop_chroma_collection(previous.collection.name)
+        if all_chunks:
+            logger.info("Indexed sources", extra={
+                **log_extra,
+                "chunk_count": len(all_chunks),
+                "reused_chunk_count": kept,
+                "unique_chunk_count": len(set(all_chunks)),
+                "source_count": len(sources)
+            })
+    
+    async def _fill_collection(
+        self,
+        indexed: IndexedCollection,
+        all_chunks: list[str],
+        all_ids: list[str],
+        all_metadatas: list[dict],
+        reused: dict[str, list[float]],
+        log_extra: dict,
+    ) -> int:
+        """Store reused vectors, embed the remaining chunks and build the keyword index.
         
-        return collection_name
+        Returns:
+            Number of chunks whose vectors were reused
+        """
+        collection = indexed.collection
+        if not all_chunks:
+            logger.warning("No content to index", extra=log_extra)
+            return 0
+        
+        def add(positions: list[int], embeddings: list) -> None:
+            collection.add(
+                ids=[all_ids[i] for i in positions],
+                embeddings=embeddings,
+                documents=[all_chunks[i] for i in positions],
+                metadatas=[all_metadatas[i] for i in positions]
+            )
+        
+        kept = [i for i, chunk_id in enumerate(all_ids) if chunk_id in reused]
+        if kept:
+            add(kept, [reused[all_ids[i]] for i in kept])
+        
+        # Embed the rest and insert in micro-batches so Chroma ingestion
+        # overlaps the next embeddings requests
+        fresh = [i for i, chunk_id in enumerate(all_ids) if chunk_id not in reused]
+        async for start, embeddings in self._embed_batches([all_chunks[i] for i in fresh]):
+            add(fresh[start:start + len(embeddings)], embeddings)
+        
+        indexed.documents = all_chunks
+        indexed.lowered = [chunk.lower() for chunk in all_chunks]
+        indexed.metadatas = all_metadatas
+        indexed.build_postings()
+        return len(kept)
     
     async def search(
         self,
@@ -224,57 +661,98 @@ class EmbeddingService:
         Returns:
             List of relevant chunks with scores
         """
-        collection_name = f"doc_{document_id}"
+        return await self._search_collection(
+            f"doc_{document_id}", query, top_k, {"document_id": document_id}
+        )
+
+    async def _search_collection(
+        self,
+        collection_name: str,
+        query: str,
+        top_k: int,
+        log_extra: dict,
+    ) -> list[ChunkResult]:
+        """Keyword-first search with semantic fallback over one collection.
         
-        if collection_name not in self._collections:
-            logger.warning("Collection not found", extra={"document_id": document_id})
+        Args:
+            collection_name: Name of the indexed collection
+            query: Search query
+            top_k: Number of results to return
+            log_extra: Context added to log records (document_id or project_id)
+            
+        Returns:
+            List of relevant chunks with scores
+        """
+        indexed = _get_collection(collection_name)
+        if indexed is None:
+            logger.warning("Collection not found", extra=log_extra)
             return []
         
-        collection = self._collections[collection_name]
-        
-        # Get all chunks for keyword search
-        all_data = collection.get(include=["documents", "metadatas"])
-        
         logger.info("RAG Search starting", extra={
+            **log_extra,
             "query": query,
             "collection": collection_name,
-            "total_chunks": len(all_data["documents"]) if all_data["documents"] else 0
+            "total_chunks": len(indexed.documents)
         })
         
-        # Keyword search: find chunks containing the query (case insensitive)
-        query_lower = query.lower()
-        keyword_matches: list[ChunkResult] = []
+        # Quoted or very short queries are lexical: never pay for an embedding
+        quoted = _QUOTED_RE.match(query)
+        if quoted:
+            query = quoted.group(1)
+        keyword_only = bool(quoted) or len(query.strip()) < MIN_SEMANTIC_QUERY_LENGTH
         
-        if all_data["documents"]:
-            for i, doc in enumerate(all_data["documents"]):
-                if query_lower in doc.lower():
-                    metadata = all_data["metadatas"][i] if all_data["metadatas"] else {}
-                    keyword_matches.append(ChunkResult(
-                        source_id=metadata.get("source_id", 0),
-                        source_title=metadata.get("source_title", "Unknown"),
-                        content=doc,
-                        score=1.0  # Perfect match
-                    ))
-                    logger.info("KEYWORD MATCH FOUND", extra={
-                        "query": query,
-                        "chunk_preview": doc[:200]
-                    })
+        # Keyword search through the inverted index (case insensitive)
+        hits = indexed.keyword_hits(query.lower())[:top_k]
         
         # If we found keyword matches, return them prioritized
-        if keyword_matches:
-            logger.info("Returning keyword matches", extra={"count": len(keyword_matches), "query": query})
-            return keyword_matches[:top_k]
+        if hits:
+            keyword_matches = [
+                ChunkResult(
+                    source_id=indexed.metadatas[i].get("source_id", 0),
+                    source_title=indexed.metadatas[i].get("source_title", "Unknown"),
+                    content=indexed.documents[i],
+                    score=1.0  # Perfect match
+                )
+                for i in hits
+            ]
+            logger.info("Returning keyword matches", extra={
+                **log_extra,
+                "count": len(keyword_matches),
+                "query": query,
+            })
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Keyword match previews: %r", [
+                    m.content[:150] for m in keyword_matches[:3]
+                ])
+            return keyword_matches
+        
+        if keyword_only:
+            logger.info("No keyword matches for lexical query", extra={**log_extra, "query": query})
+            return []
+        
+        logger.info("No keyword matches, falling back to semantic search", extra={**log_extra, "query": query})
         
-        logger.info("No keyword matches, falling back to semantic search", extra={"query": query})
+        # Repeated query: reuse earlier results without calling Mistral
+        cache_key = (top_k, query.lower().strip())
+        cached = indexed.cached_results(cache_key)
+        if cached is not None:
+            logger.debug("Query cache hit", extra={**log_extra, "query": query})
+            return cached
         
         # Fall back to semantic search
-        query_embedding = await self._embed_texts([query])
-        if not query_embedding:
+        query_embedding = await self._embed_query(query)
+        if query_embedding is None:
             return []
         
+        # Near-paraphrase of a cached query: skip the vector search
+        similar = indexed.similar_results(query_embedding, top_k)
+        if similar is not None:
+            logger.debug("Semantic query cache hit", extra={**log_extra, "query": query})
+            return similar
+        
         # Search
-        results = collection.query(
-            query_embeddings=query_embedding,
+        results = indexed.collection.query(
+            query_embeddings=[query_embedding],
             n_results=top_k,
             include=["documents", "metadatas", "distances"]
         )
@@ -286,19 +764,26 @@ class EmbeddingService:
             for i, doc in enumerate(results["documents"][0]):
                 metadata = results["metadatas"][0][i] if results["metadatas"] else {}
                 distance = results["distances"][0][i] if results["distances"] else 0
+                score = 1 - distance  # Cosine distance to similarity
                 
-                # Filter out low relevance chunks (score < 0.5)
-                if (1 - distance) >= 0.5:
+                # Filter out low relevance chunks
+                if score >= MIN_SIMILARITY:
                     chunks.append(ChunkResult(
                         source_id=metadata.get("source_id", 0),
                         source_title=metadata.get("source_title", "Unknown"),
                         content=doc,
-                        score=1 - distance  # Convert distance to similarity
+                        score=score
                     ))
         
+        indexed.remember_results(cache_key, query_embedding, chunks)
         return chunks
 
-    async def index_project_sources(self, project_id: int, sources: list["Source"]) -> str:
+    async def index_project_sources(
+        self,
+        project_id: int,
+        sources: list["Source"],
+        source_ids: Iterable[int] | None = None,
+    ) -> str:
         """Index sources for a project (for project-level chat).
         
         Similar to index_sources but uses project_id for collection naming.
@@ -306,81 +791,52 @@ class EmbeddingService:
         Args:
             project_id: ID of the project
             sources: List of sources to index
+            source_ids: Selected source IDs when sources is a subset of the
+                project's sources (None for the whole project)
             
         Returns:
             Collection name
         """
-        collection_name = f"project_{project_id}"
-        
-        # Check if already indexed with same sources
-        source_hash = _source_hash(sources)
-        if collection_name in self._collections:
-            existing = self._collections[collection_name]
-            if existing.metadata and existing.metadata.get("source_hash") == source_hash:
-                logger.debug("Project sources already indexed", extra={"project_id": project_id})
-                return collection_name
-        
-        # Create new collection
-        try:
-            self._client.delete_collection(collection_name)
-        except Exception:
-            pass  # Collection doesn't exist
-            
-        collection = self._client.create_collection(
-            name=collection_name,
-            metadata={"source_hash": source_hash}
-        )
-        
-        # Prepare chunks from all sources
-        all_chunks: list[str] = []
-        all_ids: list[str] = []
-        all_metadatas: list[dict] = []
-        
-        for source in sources:
-            content = source.processed_content or source.content
-            if not content:
-                continue
-                
-            chunks = _chunk_text(content)
-            for i, chunk in enumerate(chunks):
-                all_chunks.append(chunk)
-                all_ids.append(f"{source.id}_{i}")
-                all_metadatas.append({
-                    "source_id": source.id,
-                    "source_title": source.title,
-                    "chunk_index": i
-                })
-        
-        if not all_chunks:
-            logger.warning("No content to index for project", extra={"project_id": project_id})
-            self._collections[collection_name] = collection
-            return collection_name
-        
-        # Get embeddings
-        embeddings = await self._embed_texts(all_chunks)
-        
-        # Add to collection
-        collection.add(
-            ids=all_ids,
-            embeddings=embeddings,
-            documents=all_chunks,
-            metadatas=all_metadatas
+        return await self._index_collection(
+            _project_collection_name(project_id, source_ids),
+            sources,
+            {"project_id": project_id},
         )
+
+    def is_project_indexed(
+        self,
+        project_id: int,
+        fingerprints: Iterable[tuple[int, str, str | None]],
+    ) -> bool:
+        """Whether the whole-project collection matches the given sources.
         
-        self._collections[collection_name] = collection
-        logger.info("Indexed project sources", extra={
-            "project_id": project_id,
-            "chunk_count": len(all_chunks),
-            "source_count": len(sources)
-        })
+        Lets callers check freshness from (id, title, content_hash) columns
+        without loading any source content. Rows without a stored hash
+        count as changed.
         
-        return collection_name
+        Args:
+            project_id: ID of the project
+            fingerprints: (id, title, content_hash) of every project source
+            
+        Returns:
+            True if the indexed collection is up to date
+        """
+        indexed = _get_collection(_project_collection_name(project_id, None))
+        if indexed is None:
+            return False
+        content_hashes: dict[int, str] = {}
+        titles: dict[int, str] = {}
+        for source_id, title, content_hash in fingerprints:
+            content_hashes[source_id] = content_hash or ""
+            titles[source_id] = title
+        return indexed.source_hash == _source_hash(content_hashes, titles)
 
     async def search_project(
         self,
         project_id: int,
         query: str,
-        top_k: int = 5
+        top_k: int = 5,
+        source_ids: Iterable[int] | None = None,
     ) -> list[ChunkResult]:
         """Search for relevant chunks in project sources.
         
@@ -388,82 +844,14 @@ class EmbeddingService:
             project_id: ID of the project
             query: Search query
             top_k: Number of results to return
+            source_ids: Same selection passed to index_project_sources
             
         Returns:
             List of relevant chunks with scores
         """
-        collection_name = f"project_{project_id}"
-        
-        if collection_name not in self._collections:
-            logger.warning("Project collection not found", extra={"project_id": project_id})
-            return []
-        
-        collection = self._collections[collection_name]
-        
-        # Get all chunks for keyword search
-        all_data = collection.get(include=["documents", "metadatas"])
-        
-        logger.info("Project RAG Search starting", extra={
-            "query": query,
-            "collection": collection_name,
-            "total_chunks": len(all_data["documents"]) if all_data["documents"] else 0
-        })
-        
-        # Keyword search: find chunks containing the query (case insensitive)
-        query_lower = query.lower()
-        keyword_matches: list[ChunkResult] = []
-        
-        if all_data["documents"]:
-            for i, doc in enumerate(all_data["documents"]):
-                if query_lower in doc.lower():
-                    metadata = all_data["metadatas"][i] if all_data["metadatas"] else {}
-                    keyword_matches.append(ChunkResult(
-                        source_id=metadata.get("source_id", 0),
-                        source_title=metadata.get("source_title", "Unknown"),
-                        content=doc,
-                        score=1.0  # Perfect match
-                    ))
-        
-        # If we found keyword matches, return them prioritized
-        if keyword_matches:
-            logger.info("Returning keyword matches for project", extra={
-                "count": len(keyword_matches), 
-                "query": query,
-                "chunk_previews": [m.content[:150] for m in keyword_matches[:3]]
-            })
-            return keyword_matches[:top_k]
-        
-        logger.info("No keyword matches for project, falling back to semantic search", extra={"query": query})
-        
-        # Fall back to semantic search
-        query_embedding = await self._embed_texts([query])
-        if not query_embedding:
-            return []
-        
-        # Search
-        results = collection.query(
-            query_embeddings=query_embedding,
-            n_results=top_k,
-            include=["documents", "metadatas", "distances"]
+        return await self._search_collection(
+            _project_collection_name(project_id, source_ids),
+            query,
+            top_k,
+            {"project_id": project_id},
         )
-        
-        # Format results
-        chunks: list[ChunkResult] = []
-        
-        if results["documents"] and results["documents"][0]:
-            for i, doc in enumerate(results["documents"][0]):
-                metadata = results["metadatas"][0][i] if results["metadatas"] else {}
-                distance = results["distances"][0][i] if results["distances"] else 0
-                score = 1 - distance
-                
-                # Filter out low relevance chunks (score < 0.5)
-                if score >= 0.5:
-                    chunks.append(ChunkResult(
-                        source_id=metadata.get("source_id", 0),
-                        source_title=metadata.get("source_title", "Unknown"),
-                        content=doc,
-                        score=score
-                    ))
-        
-        return chunks
-
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import asyncio
 import json
+import os
 import shutil
 from pathlib import Path
 from typing import BinaryIO
@@ -8,6 +10,8 @@ from typing import BinaryIO
 from app.core.settings import settings
 from app.models.metadata import AudioMetadata
 from app.utils.audio import (
+    AUDIO_MIME_BY_EXTENSION,
+    DEFAULT_AUDIO_MIME_TYPE,
     build_recording_path,
     compute_duration_seconds,
     convert_webm_to_mp3,
@@ -19,6 +23,11 @@ from app.utils.audio import (
 )
 
 
+# Copy uploads in 1MB blocks: large enough to keep syscalls few, small
+# enough that memory per upload stays flat regardless of file size
+COPY_BUFFER_SIZE = 1024 * 1024
+
+
 class FileService:
     """Handle all file I/O operations (audio uploads, conversions, metadata extraction)."""
 
@@ -63,18 +72,29 @@ class FileService:
         destination = build_recording_path(user_id, project_id, final_filename)
         temp_destination = destination.with_suffix(".webm") if is_webm else destination
 
-        # Write uploaded file
-        size_bytes = self._write_file(temp_destination, file_content)
-        ensure_within_limits(size_bytes)
+        # Reject oversized uploads before anything is written to disk
+        upload_size = self._stream_size(file_content)
+        if upload_size is not None:
+            ensure_within_limits(upload_size)
 
-        # Convert WebM to MP3 if needed
+        # Write uploaded file
+        size_bytes = await asyncio.to_thread(self._write_file, temp_destination, file_content)
+        try:
+            ensure_within_limits(size_bytes)
+        except ValueError:
+            temp_destination.unlink(missing_ok=True)
+            raise
+
+        # Convert WebM to MP3 if needed (ffmpeg reports the duration it encoded)
+        duration_seconds: int | None = None
         if is_webm:
-            convert_webm_to_mp3(temp_destination, destination)
+            duration_seconds = await convert_webm_to_mp3(temp_destination, destination)
             temp_destination.unlink()  # Remove temporary WebM
             size_bytes = destination.stat().st_size  # Update size for final MP3
 
-        # Extract audio duration (reliable with MP3/WAV/M4A)
-        duration_seconds = compute_duration_seconds(destination)
+        # Extract audio duration from headers (reliable with MP3/WAV/M4A)
+        if duration_seconds is None:
+            duration_seconds = compute_duration_seconds(destination)
         validate_audio_duration(duration_seconds)
 
         # Determine audio format from file extension
@@ -85,6 +105,7 @@ class FileService:
             duration_seconds=duration_seconds,
             size_bytes=size_bytes,
             format=audio_format,
+            mime_type=AUDIO_MIME_BY_EXTENSION.get(audio_format, DEFAULT_AUDIO_MIME_TYPE),
             # Note: sample_rate and channels could be extracted with pydub if needed
             # For now, keeping them as None (optional fields)
         )
@@ -127,19 +148,19 @@ class FileService:
         storage_root = Path(settings.file_storage_root)
         destination = storage_root / str(user_id) / str(project_id) / "pdf" / final_filename
 
-        # Write uploaded file
-        size_bytes = self._write_file(destination, file_content)
+        # Validate size (50MB max for PDFs), before writing when the upload
+        # is seekable so oversized files never touch the disk
+        upload_size = self._stream_size(file_content)
+        if upload_size is not None:
+            self._ensure_pdf_size(upload_size)
 
-        # Validate size (50MB max for PDFs)
-        max_size_mb = 50
-        max_size_bytes = max_size_mb * 1024 * 1024
-        if size_bytes > max_size_bytes:
-            # Clean up file
+        # Write uploaded file
+        size_bytes = await asyncio.to_thread(self._write_file, destination, file_content)
+        try:
+            self._ensure_pdf_size(size_bytes)
+        except ValueError:
             destination.unlink(missing_ok=True)
-            raise ValueError(
-                f"PDF file too large: {size_bytes / (1024 * 1024):.1f}MB "
-                f"(maximum allowed size: {max_size_mb}MB)"
-            )
+            raise
 
         # Return file path and metadata
         metadata = {
@@ -181,11 +202,34 @@ class FileService:
         return False
 
     # Private helper methods
+    @staticmethod
+    def _stream_size(file_stream: BinaryIO) -> int | None:
+        """Bytes left in a seekable upload stream, without reading it."""
+        if not file_stream.seekable():
+            return None
+        position = file_stream.tell()
+        end = file_stream.seek(0, os.SEEK_END)
+        file_stream.seek(position)
+        return end - position
+
+    @staticmethod
+    def _ensure_pdf_size(size_bytes: int) -> None:
+        """Raise ValueError if a PDF exceeds the 50MB limit."""
+        max_size_mb = 50
+        if size_bytes > max_size_mb * 1024 * 1024:
+            raise ValueError(
+                f"PDF file too large: {size_bytes / (1024 * 1024):.1f}MB "
+                f"(maximum allowed size: {max_size_mb}MB)"
+            )
+
     @staticmethod
     def _write_file(destination: Path, file_stream: BinaryIO) -> int:
         """
         Write binary file stream to disk.
 
+        Blocking; callers run it in a worker thread so large uploads don't
+        stall the event loop.
+
         Args:
             destination: Path where file should be written
             file_stream: Binary stream to read from
@@ -194,11 +238,6 @@ class FileService:
             Number of bytes written
         """
         destination.parent.mkdir(parents=True, exist_ok=True)
-        total = 0
         with destination.open("wb") as out_file:
-            for chunk in iter(lambda: file_stream.read(8192), b""):
-                if not chunk:
-                    break
-                out_file.write(chunk)
-                total += len(chunk)
-        return total
+            shutil.copyfileobj(file_stream, out_file, COPY_BUFFER_SIZE)
+            return out_file.tell()
@@ -1,13 +1,17 @@
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import logging
-from datetime import UTC, datetime
+from collections.abc import Iterator
+from pathlib import Path
 
-from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy import Row, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import raiseload
 
-from app.db.session import get_session
+from app.core.settings import settings
+from app.db.session import get_worker_session
 from app.generators.base import DocumentProviderError
 from app.models import (
     Document,
@@ -19,12 +23,15 @@ from app.models import (
     User,
 )
 from app.generators import GeneratorRegistry
+from app.processors.base import SourceProcessor
 from app.processors.registry import ProcessorRegistry
 from app.services.file import FileService
 from app.services.processing_job import ProcessingJobService
 from app.services.generation_job import GenerationJobService
+from app.services.llm_cache import llm_cache, make_cache_key
 from app.services.projects import ProjectService
 from app.services.transcription import STTProviderError
+from app.utils.audio import AUDIO_MIME_BY_EXTENSION, DEFAULT_AUDIO_MIME_TYPE
 from app.utils.text_extraction import TextExtractionError, extract_text_from_source
 from app.utils.tokens import estimate_tokens
 
@@ -38,7 +45,8 @@ async def run_processing_job(
 ) -> None:
     """Process transcription queue for a project.
 
-    Transcribes all recordings without transcripts, one at a time.
+    Transcribes all recordings without transcripts, up to
+    `settings.max_processing_concurrency` at a time.
     Updates project status based on overall progress.
 
     Args:
@@ -50,7 +58,7 @@ async def run_processing_job(
 
     # Create session if not provided (for backward compat with background tasks)
     if session is None:
-        async for session in get_session():
+        async for session in get_worker_session():
             await _run_processing_job_impl(project_id, provider, session)
             return
     else:
@@ -67,66 +75,128 @@ async def _run_processing_job_impl(
     project_svc = ProjectService(session, user=None, file_service=file_svc)  # No user context for background job
     job_svc = ProcessingJobService(session)
 
-    # Load project with sources
-    project = await project_svc.get_project_for_job(project_id, with_sources=True)
+    # Cheap EXISTS probe first: the common "nothing to do" case never loads
+    # the project graph
+    has_pending = await project_svc.has_pending_processing_sources(project_id)
+    if has_pending is None:
+        logger.error("Project not found", extra={"project_id": project_id})
+        return
+    if not has_pending:
+        logger.info("No pending sources to process", extra={"project_id": project_id})
+        await job_svc.start_project_job(project_id, JobStatus.SUCCEEDED)
+        await session.commit()
+        return
+
+    # Load project (owner is eager-loaded; sources are queried separately)
+    project = await project_svc.get_project_for_job(project_id)
     if not project:
         logger.error("Project not found", extra={"project_id": project_id})
         return
 
+    owner = project.owner  # Eager-loaded by get_project_for_job
+    if not owner:
+        logger.error("Project owner not found", extra={"project_id": project_id})
+        return
+
     # Get all audio AND PDF sources without processed content
-    sources_to_process = [
-        s for s in (project.sources or [])
-        if getattr(s, 'type', None) in [SourceType.AUDIO, SourceType.PDF] and not s.processed_content
-    ]
+    sources_to_process = await project_svc.get_pending_processing_sources(project_id)
     logger.info("Found sources to process", extra={
         "project_id": project_id,
         "count": len(sources_to_process),
-        "types": [getattr(s, 'type', None) for s in sources_to_process]
+        "types": [s.type for s in sources_to_process]
     })
 
     if not sources_to_process:
+        # Processed concurrently since the probe above
         logger.info("No pending sources to process", extra={"project_id": project_id})
-        job = await job_svc.get_or_create_job(project_id)
-        await job_svc.mark_succeeded(job.id)
+        await job_svc.start_project_job(project_id, JobStatus.SUCCEEDED)
         await session.commit()
         return
 
-    # Get or create job
-    job = await job_svc.get_or_create_job(project_id)
+    # Get or create job, already IN_PROGRESS
+    job = await job_svc.start_project_job(project_id, JobStatus.IN_PROGRESS)
     job_id = job.id
-    await job_svc.mark_in_progress(job_id)
     await session.commit()
     logger.info("Processing job marked as IN_PROGRESS", extra={"project_id": project_id})
 
-    # Process sources sequentially
-    for idx, source in enumerate(sources_to_process, 1):
-        src_name = getattr(source, 'title', f"source#{getattr(source, 'id', '?')}")
-        src_type = getattr(source, 'type', 'unknown')
-        logger.info("Processing source", extra={
-            "project_id": project_id,
-            "source_idx": idx,
-            "total_sources": len(sources_to_process),
-            "source_title": src_name,
-            "source_type": src_type
-        })
-        try:
-            await _transcribe_audio_source(session, source, provider)
-            logger.info("Successfully processed source", extra={
+    # Resolve the API key once for every source (user's own key or demo key)
+    from app.services.api_key_resolver import get_effective_api_key
+    api_key = await get_effective_api_key(owner, session)
+    if not api_key:
+        await job_svc.mark_failed(job_id, "API key not configured and no active demo access")
+        await session.commit()
+        return
+    # Hand the job's connection back while sources are processed (minutes);
+    # the session reconnects to record the outcome
+    await session.close()
+
+    # Process sources concurrently; each worker gets its own session since
+    # AsyncSession can't be shared across tasks and each source commits
+    worker_sessions = async_sessionmaker(session.bind, expire_on_commit=False, class_=AsyncSession)
+    semaphore = asyncio.Semaphore(settings.max_processing_concurrency)
+
+    async def process(idx: int, source: Row) -> None:
+        src_name = source.title or f"source#{source.id}"
+        src_type = source.type
+        async with semaphore:
+            logger.info("Processing source", extra={
                 "project_id": project_id,
+                "source_idx": idx,
+                "total_sources": len(sources_to_process),
                 "source_title": src_name,
                 "source_type": src_type
             })
-        except Exception as exc:  # pragma: no cover - defensive catch
-            logger.error("Error processing source", extra={
+            try:
+                # Only hold a connection to load the source and to save the
+                # result, not during the provider call
+                async with worker_sessions() as worker_session:
+                    worker_source = await worker_session.get(Source, source.id)
+                if worker_source is None:
+                    # Deleted since the job listed it: nothing to process
+                    logger.warning("Source vanished before processing", extra={
+                        "project_id": project_id,
+                        "source_id": source.id,
+                        "source_title": src_name,
+                    })
+                    return
+                processed_content = await _transcribe_audio_source(
+                    worker_source, provider, api_key, processors
+                )
+                token_count = await asyncio.to_thread(estimate_tokens, processed_content)
+                async with worker_sessions() as worker_session:
+                    await _save_processed_content(
+                        worker_session, source.id, processed_content, token_count
+                    )
+            except Exception as exc:
+                logger.error("Error processing source", extra={
+                    "project_id": project_id,
+                    "source_title": src_name,
+                    "source_type": src_type,
+                    "error": str(exc)
+                })
+                raise STTProviderError(f"Source {src_name}: {str(exc)}") from exc
+            logger.info("Successfully processed source", extra={
                 "project_id": project_id,
                 "source_title": src_name,
-                "source_type": src_type,
-                "error": str(exc)
+                "source_type": src_type
             })
-            await session.rollback()
-            await job_svc.mark_failed(job_id, f"Source {src_name}: {str(exc)}")
-            await session.commit()
-            return
+
+    # The first failure cancels the remaining sources, as the sequential
+    # loop used to stop at the first error
+    processors: dict[type[SourceProcessor], SourceProcessor] = {}
+    error: Exception | None = None
+    try:
+        async with asyncio.TaskGroup() as tg:
+            for idx, source in enumerate(sources_to_process, 1):
+                tg.create_task(process(idx, source))
+    except* Exception as eg:
+        error = eg.exceptions[0]
+    finally:
+        await asyncio.gather(*(p.aclose() for p in processors.values()), return_exceptions=True)
+    if error is not None:
+        await job_svc.mark_failed(job_id, str(error))
+        await session.commit()
+        return
 
     # All sources processed successfully
     logger.info("All sources processed successfully", extra={"project_id": project_id})
@@ -157,7 +227,7 @@ async def run_document_job(
 
     # Create session if not provided (for backward compat with background tasks)
     if session is None:
-        async for session in get_session():
+        async for session in get_worker_session():
             await _run_document_job_impl(
                 project_id, provider, source_ids, document_title, document_type, session
             )
@@ -181,18 +251,15 @@ async def _run_document_job_impl(
     project_svc = ProjectService(session, user=None, file_service=file_svc)  # No user context for background job
     job_svc = GenerationJobService(session)
 
-    # Load project with sources
-    project = await project_svc.get_project_for_job(
-        project_id, with_sources=True, with_document=False
-    )
+    # Load project (sources are queried once below, with the ID filter)
+    project = await project_svc.get_project_for_job(project_id)
     if not project:
         logger.error("Project not found", extra={"project_id": project_id})
         return
 
-    # Get or create job
-    job = await job_svc.get_or_create_job(project_id)
+    # Get or create job, already IN_PROGRESS
+    job = await job_svc.start_project_job(project_id, JobStatus.IN_PROGRESS)
     job_id = job.id
-    await job_svc.mark_in_progress(job_id)
     await session.commit()
     logger.info("Generation job marked as IN_PROGRESS", extra={"project_id": project_id})
 
@@ -202,7 +269,7 @@ async def _run_document_job_impl(
     try:
         markdown = await _generate_project_document(
             session, project, provider,
-            source_ids=source_ids,
+            sources=sources_used,
             document_title=document_title,
             document_type=document_type,
         )
@@ -216,26 +283,24 @@ async def _run_document_job_impl(
         await session.commit()
         return
 
-    # Always create a new document
-    now = datetime.now(tz=UTC)
+    # Always create a new document (created_at comes from the column default)
     document = Document(
         project_id=project.id,
         provider=provider,
         title=document_title,
         markdown=markdown,
-        created_at=now,
         type=document_type
     )
     session.add(document)
     await session.flush()  # Flush to get document.id
 
-    # Link document to sources used for generation (for chat context)
-    for source in sources_used:
-        doc_source = DocumentSource(
-            document_id=document.id,
-            source_id=source.id
+    # Link document to sources used for generation (for chat context), as a
+    # single executemany INSERT instead of one ORM object per link
+    if sources_used:
+        await session.execute(
+            insert(DocumentSource),
+            [{"document_id": document.id, "source_id": source.id} for source in sources_used],
         )
-        session.add(doc_source)
 
     # Mark job as succeeded
     await job_svc.mark_succeeded(job.id)
@@ -246,75 +311,77 @@ async def _run_document_job_impl(
     })
 
 
-async def _transcribe_audio_source(session: AsyncSession, source: Source, provider: str) -> None:
-    """Process a single source (audio or PDF) and save the result."""
-    provider_lower = provider.lower()
+def _source_mime_type(source: Source) -> str:
+    """MIME type used to pick the processor for a source.
 
-    # Get the project and owner
-    project = await session.get(Project, source.project_id)
-    if not project:
-        raise STTProviderError("Project not found")
+    Audio uploads record it in source_metadata; older audio sources only
+    have the file extension, which is mapped the same way.
+    """
+    if source.type == SourceType.PDF:
+        return "application/pdf"
+    if source.type != SourceType.AUDIO:
+        raise STTProviderError(f"Unsupported source type: {source.type}")
 
-    owner = project.owner or await session.get(User, project.user_id)
-    if not owner:
-        raise STTProviderError("Project owner not found")
+    metadata = source.source_metadata or {}
+    if metadata.get("mime_type"):
+        return metadata["mime_type"]
 
-    # Get effective API key (user's own key or demo key)
-    from app.services.api_key_resolver import get_effective_api_key
-    api_key = await get_effective_api_key(owner, session)
-    if not api_key:
-        raise STTProviderError("API key not configured and no active demo access")
+    audio_format = (metadata.get("format") or Path(source.file_path or "").suffix.lstrip(".")).lower()
+    if audio_format.startswith("audio/"):
+        return audio_format
+    return AUDIO_MIME_BY_EXTENSION.get(audio_format, DEFAULT_AUDIO_MIME_TYPE)
 
-    # Use ProcessorRegistry to get the processor class based on source format
-    # Get source format/MIME type
-    source_format = None
-    if source.type == SourceType.AUDIO:
-        # Audio sources use MIME type like 'audio/mpeg'
-        source_format = getattr(source, 'source_metadata', {}).get('format') if hasattr(source, 'source_metadata') else None
-        
-        # If format is an extension (e.g., 'mp3'), convert to MIME type
-        if source_format and not source_format.startswith('audio/'):
-            extension_to_mime = {
-                'mp3': 'audio/mpeg',
-                'wav': 'audio/wav',
-                'webm': 'audio/webm',
-                'm4a': 'audio/mp4',
-                'aac': 'audio/aac',
-            }
-            source_format = extension_to_mime.get(source_format.lower())
-        
-        if not source_format:
-            # Fallback: guess from file extension
-            import mimetypes
-            from pathlib import Path
-            if source.file_path:
-                source_format, _ = mimetypes.guess_type(source.file_path)
-        if not source_format:
-            source_format = "audio/mpeg"  # Default fallback
-    elif source.type == SourceType.PDF:
-        source_format = "application/pdf"
-    else:
-        raise STTProviderError(f"Unsupported source type: {source.type}")
 
+def _get_processor(
+    processors: dict[type[SourceProcessor], SourceProcessor],
+    source_format: str,
+    provider: str,
+    api_key: str,
+) -> SourceProcessor:
+    """Return the job's processor for a format, creating it on first use.
+
+    Reusing one instance per processor class lets its HTTP client keep
+    connections alive across sources (all sources share the job's API key).
+    """
     processor_class = ProcessorRegistry.get_processor(source_format)
     if not processor_class:
         raise STTProviderError(f"No processor found for format: {source_format}")
 
-    # Configure processor with the resolved API key
-    try:
-        config_class = processor_class.config_class()
-        config = config_class(api_key=api_key)
-    except Exception as exc:
-        raise STTProviderError(f"Configuration failed for provider {provider}: {str(exc)}")
+    processor = processors.get(processor_class)
+    if processor is None:
+        # Configure processor with the resolved API key
+        try:
+            config_class = processor_class.config_class()
+            config = config_class(api_key=api_key)
+        except Exception as exc:
+            raise STTProviderError(f"Configuration failed for provider {provider}: {str(exc)}")
+        processor = processors[processor_class] = processor_class(config)
+    return processor
+
 
-    # Perform processing
-    processor = processor_class(config)
+async def _transcribe_audio_source(
+    source: Source,
+    provider: str,
+    api_key: str,
+    processors: dict[type[SourceProcessor], SourceProcessor],
+) -> str:
+    """Process a single source (audio or PDF) and return its text.
+
+    Takes no session: the caller saves the result with
+    `_save_processed_content`, so no connection is held during the
+    provider call. The API key is resolved once per job by the caller;
+    don't resolve it here, that would cost a demo-access query per source.
+    Processor instances are shared through `processors` for the whole job.
+    """
+    # Use ProcessorRegistry to get the processor class based on source format
+    source_format = _source_mime_type(source)
+
+    processor = _get_processor(processors, source_format, provider, api_key)
 
     if not getattr(source, 'file_path', None):
         source_type_str = str(getattr(source, 'type', 'UNKNOWN')).upper()
         raise STTProviderError(f"{source_type_str} source missing file path")
 
-    from pathlib import Path
     result = await processor.process(file_path=Path(source.file_path))
 
     if not result.success:
@@ -323,9 +390,22 @@ async def _transcribe_audio_source(session: AsyncSession, source: Source, provid
     if not result.processed_content or not result.processed_content.strip():
         raise STTProviderError("Processor returned empty result")
 
-    # Store result in source.processed_content
-    source.processed_content = result.processed_content.strip()
-    source.token_count = estimate_tokens(source.processed_content)
+    return result.processed_content.strip()
+
+
+async def _save_processed_content(
+    session: AsyncSession,
+    source_id: int,
+    processed_content: str,
+    token_count: int,
+) -> None:
+    """Store a source's processed text, unless it was deleted meanwhile."""
+    source = await session.get(Source, source_id)
+    if source is None:
+        logger.warning("Source vanished during processing", extra={"source_id": source_id})
+        return
+    source.processed_content = processed_content
+    source.token_count = token_count
     await session.commit()
 
 
@@ -334,21 +414,24 @@ async def _generate_project_document(
     project: Project,
     provider: str,
     *,
-    source_ids: list[int] | None = None,
+    sources: list[Source],
     document_title: str | None = None,
     document_type: str = "cours",
 ) -> str:
-    """Generate document from project sources using specified provider."""
-    provider_lower = provider.lower()
+    """Generate document from project sources using specified provider.
 
-    # Verify provider is supported
-    if not GeneratorRegistry.is_supported(provider_lower):
-        raise DocumentProviderError(f"Unsupported document provider: {provider}")
+    `sources` are the ones loaded by `_get_sources_for_document` in the
+    job, which also links them to the new document.
 
-    # Get generator class from registry
-    generator_class = GeneratorRegistry.get_generator(provider_lower)
+    The owner's API key is resolved exactly once here, before any source
+    text is extracted; keep it out of per-source code paths.
+    """
+    # Routes normalize the provider name before enqueueing; a single
+    # registry lookup both validates it and returns the generator class
+    provider = provider.lower()
+    generator_class = GeneratorRegistry.get_generator(provider)
     if not generator_class:
-        raise DocumentProviderError(f"Generator not found for provider: {provider}")
+        raise DocumentProviderError(f"Unsupported document provider: {provider}")
 
     owner = project.owner or await session.get(User, project.user_id)
     if not owner:
@@ -360,26 +443,33 @@ async def _generate_project_document(
     if not api_key:
         raise DocumentProviderError("API key not configured and no active demo access")
 
-    # Get sources (all or filtered by IDs)
-    sources = await _get_sources_for_document(session, project, source_ids)
-    
     if not sources:
         raise DocumentProviderError("No sources available")
 
-    # Extract text from each source
-    text_parts: list[str] = []
-    for source in sources:
-        try:
-            text = extract_text_from_source(source)
-            if text and text.strip():
-                text_parts.append(f"=== Source: {source.title} ===\n\n{text}")
-        except TextExtractionError as exc:
-            # Skip sources that can't be extracted (e.g., audio without transcript)
-            continue
+    # Extract text from each source, off the event loop: stripping and
+    # hashing large transcripts is CPU-bound
+    source_texts, part_hashes = await asyncio.to_thread(_prepare_source_texts, sources)
 
-    if not text_parts:
+    if not source_texts:
         raise DocumentProviderError("No content available from sources")
 
+    # Identical prompt (same sources, type and titles): reuse the last output
+    cache_key = make_cache_key(
+        provider=provider,
+        document_type=document_type,
+        sources=part_hashes,
+        document_title=document_title,
+        project_title=project.title,
+    )
+    if settings.llm_cache_enabled:
+        cached = await llm_cache.get(cache_key)
+        if cached is not None:
+            logger.info("Document served from LLM cache", extra={
+                "project_id": project.id,
+                **llm_cache.stats(),
+            })
+            return cached
+
     # Create generator instance using registry with resolved API key
     try:
         config_class = generator_class.config_class()
@@ -396,7 +486,7 @@ async def _generate_project_document(
 
     # Generate document from all text parts
     result = await generator.generate(
-        source_texts=text_parts,
+        source_texts=_iter_source_texts(source_texts),
         document_type=document_type,
         metadata=metadata,
     )
@@ -407,29 +497,71 @@ async def _generate_project_document(
     if not result.markdown_content:
         raise DocumentProviderError("Generator returned empty content")
 
+    if settings.llm_cache_enabled:
+        await llm_cache.set(cache_key, result.markdown_content, ttl=settings.llm_cache_ttl_seconds)
     return result.markdown_content
 
 
+def _prepare_source_texts(sources: list[Source]) -> tuple[list[tuple[str, str]], list[str]]:
+    """Collect each source's text and its content hash.
+
+    Sources without extractable text (e.g., audio without transcript) are
+    skipped, as are sources whose text duplicates an earlier one (same PDF
+    uploaded twice, same recording transcribed twice): sending it again
+    only costs tokens. Texts are returned as (title, text) references rather than
+    formatted copies; `_iter_source_texts` formats them one at a time as
+    the generator consumes them. Only reads already-loaded column
+    attributes, so it is safe to run in a worker thread.
+
+    Returns:
+        Tuple of ((title, text) pairs, sha256 hex digest of each pair)
+    """
+    texts: list[tuple[str, str]] = []
+    hashes: list[str] = []
+    seen: set[bytes] = set()
+    for source in sources:
+        try:
+            text = extract_text_from_source(source)
+        except TextExtractionError:
+            continue
+        if text and text.strip():
+            content_digest = hashlib.blake2b(text.encode(), digest_size=16).digest()
+            if content_digest in seen:
+                logger.info("Skipping duplicate source content", extra={"source_id": source.id})
+                continue
+            seen.add(content_digest)
+            digest = hashlib.sha256(source.title.encode())
+            digest.update(b"\0")
+            digest.update(text.encode())
+            texts.append((source.title, text))
+            hashes.append(digest.hexdigest())
+    return texts, hashes
+
+
+def _iter_source_texts(texts: list[tuple[str, str]]) -> Iterator[str]:
+    """Yield generator input for each source, formatted on demand."""
+    for title, text in texts:
+        yield f"=== Source: {title} ===\n\n{text}"
+
+
 async def _get_sources_for_document(
     session: AsyncSession,
     project: Project,
     source_ids: list[int] | None,
 ) -> list[Source]:
-    """Get sources for document generation, with optional filtering."""
-    if source_ids:
-        stmt = (
-            select(Source)
-            .where(Source.project_id == project.id, Source.id.in_(source_ids))
-            .order_by(Source.created_at)
-        )
-        result = await session.execute(stmt)
-        return list(result.scalars().all())
+    """Get sources for document generation, with optional filtering.
 
-    # No filters: return all sources
+    Generation only reads source columns; raiseload turns any accidental
+    lazy relationship access into an immediate error instead of an N+1.
+    """
     stmt = (
         select(Source)
         .where(Source.project_id == project.id)
         .order_by(Source.created_at)
+        .options(raiseload("*"))
     )
+    if source_ids:
+        stmt = stmt.where(Source.id.in_(source_ids))
+
     result = await session.execute(stmt)
     return list(result.scalars().all())
@@ -0,0 +1,80 @@
+"""In-process cache for deterministic LLM responses.
+
+Document generation re-sends the same prompt whenever a user re-triggers it
+on unchanged sources. Responses are cached by a hash of everything that
+shapes the prompt, with a TTL and a bounded LRU size.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL_SECONDS = 24 * 3600
+DEFAULT_MAX_ENTRIES = 256
+
+
+def make_cache_key(**parts: Any) -> str:
+    """Build a stable cache key from JSON-serializable prompt parts.
+
+    Args:
+        **parts: Everything that influences the LLM output
+
+    Returns:
+        SHA-256 hex digest of the canonical JSON encoding
+    """
+    payload = json.dumps(parts, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class LLMResponseCache:
+    """TTL + LRU cache of LLM responses, keyed by `make_cache_key`."""
+
+    def __init__(
+        self,
+        ttl_seconds: int = DEFAULT_TTL_SECONDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float, str]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    async def get(self, key: str) -> str | None:
+        """Return the cached response, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None or entry[0] < time.monotonic():
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    async def set(self, key: str, value: str, ttl: int | None = None) -> None:
+        """Store a response, evicting the least recently used entries."""
+        expires_at = time.monotonic() + (ttl if ttl is not None else self.ttl_seconds)
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every cached response."""
+        self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        """Hit/miss counters and current size."""
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._entries)}
+
+
+# Shared by all document generation jobs in this process
+llm_cache = LLMResponseCache()
@@ -6,22 +6,63 @@ Inherits common agentic loop logic from BaseChatService.
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 from datetime import UTC, datetime
+from functools import lru_cache
 from typing import AsyncIterator, Any
 
-from sqlalchemy import select, func
+from sqlalchemy import func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from app.models import ProjectChatMessage, ProjectChatSession, Project, Source, User
-from app.services.base_chat import BaseChatService, MAX_HISTORY_MESSAGES
+from app.services.base_chat import (
+    EVENT_PREFIX,
+    MAX_HISTORY_MESSAGES,
+    SEARCH_COMPLETE_EVENT,
+    BaseChatService,
+)
 from app.services.embedding import EmbeddingService
 
 logger = logging.getLogger(__name__)
 
 
+# Keeps prewarm tasks referenced until they finish
+_prewarm_tasks: set[asyncio.Task[None]] = set()
+# Projects with a prewarm in flight: reopening the panel doesn't start another
+_prewarming_projects: set[int] = set()
+
+
+@lru_cache(maxsize=256)
+def _project_system_prompt(project_title: str, source_titles: tuple[str, ...], source_count: int) -> str:
+    """Render the project chat system prompt.
+
+    Memoized on everything it depends on, so consecutive turns in a project
+    reuse the same string and edits (renamed project, new source) miss.
+    """
+    source_summary = ", ".join(source_titles)
+    if source_count > len(source_titles):
+        source_summary += f" (et {source_count - len(source_titles)} autres)"
+
+    return f"""Tu es un assistant pédagogique pour un étudiant consultant ses sources de projet.
+
+PROJET: {project_title}
+SOURCES DISPONIBLES: {source_summary}
+
+RÈGLES IMPORTANTES:
+1. Si l'utilisateur pose une QUESTION sur le contenu → UTILISE L'OUTIL search_sources
+2. Si l'utilisateur dit "bonjour", "merci", ou fait la conversation → réponds normalement SANS utiliser l'outil
+3. Quand tu utilises l'outil, base ta réponse sur les extraits retournés
+
+STYLE DE RÉPONSE:
+- Sois CONCIS: 1-3 paragraphes maximum
+- Réponds en français
+- NE CITE JAMAIS les sources dans ta réponse (affichées automatiquement par l'interface)
+"""
+
+
 class ProjectChatService(BaseChatService):
     """Service for managing project-level chat conversations.
     
@@ -36,6 +77,8 @@ class ProjectChatService(BaseChatService):
         """Initialize ProjectChatService."""
         super().__init__(session, user)
         self._embedding_service: EmbeddingService | None = None
+        # Source selection of the current message (None: whole project)
+        self._source_ids: tuple[int, ...] | None = None
 
     def _get_embedding_service(self) -> EmbeddingService:
         """Lazy-load embedding service."""
@@ -43,17 +86,75 @@ class ProjectChatService(BaseChatService):
             self._embedding_service = EmbeddingService(self.user)
         return self._embedding_service
 
-    async def get_project(self, project_id: int) -> Project | None:
-        """Get project with sources preloaded."""
-        result = await self.session.execute(
-            select(Project)
-            .options(selectinload(Project.sources))
-            .where(Project.id == project_id)
-        )
-        project = result.scalar_one_or_none()
-        if not project or project.user_id != self.user.id:
-            return None
-        return project
+    def prewarm(self, project_id: int) -> None:
+        """Index the project's sources in the background, ahead of the first message.
+
+        Called when the user opens a project's chat. The index is shared
+        process-wide, so the first send_message finds it ready instead of
+        paying for chunking and embedding. Only the whole-project collection
+        is prewarmed; chats restricted to some sources index their own.
+        Does nothing without an API key, while a prewarm for the project is
+        already running, or (checked in the task, from source ids and
+        content hashes only) when the index is already current.
+
+        Args:
+            project_id: ID of a project the user has access to
+        """
+        from app.services.api_key_resolver import get_effective_api_key_sync
+        if not get_effective_api_key_sync(self.user):
+            return
+        if project_id in _prewarming_projects:
+            return
+        _prewarming_projects.add(project_id)
+        task = asyncio.create_task(self._prewarm(project_id))
+        _prewarm_tasks.add(task)
+        task.add_done_callback(_prewarm_tasks.discard)
+        task.add_done_callback(lambda _: _prewarming_projects.discard(project_id))
+
+    async def _prewarm(self, project_id: int) -> None:
+        # The request's session is closed by the time this runs
+        from app.db import session as db_session
+        embedding_svc = self._get_embedding_service()
+        try:
+            async with db_session.AsyncSessionLocal() as session:
+                # Freshness check on narrow columns: an up-to-date index (the
+                # usual case when the panel is reopened) never reads content
+                result = await session.execute(
+                    select(Source.id, Source.title, Source.content_hash)
+                    .where(Source.project_id == project_id)
+                )
+                fingerprints = result.all()
+                if not fingerprints or embedding_svc.is_project_indexed(project_id, fingerprints):
+                    return
+                result = await session.execute(
+                    select(Source).where(Source.project_id == project_id)
+                )
+                sources = list(result.scalars().all())
+            await embedding_svc.index_project_sources(project_id, sources)
+        except Exception as exc:
+            logger.warning("Chat index prewarm failed", extra={
+                "project_id": project_id,
+                "error": str(exc),
+            })
+
+    async def get_project(self, project_id: int, *, with_sources: bool = False) -> Project | None:
+        """Get a project owned by the current user.
+
+        Most callers only need the ownership check, so sources are loaded
+        only on request (chat messages need them for RAG indexing).
+
+        Args:
+            project_id: ID of the project
+            with_sources: Preload the project's sources
+
+        Returns:
+            Project if found and owned by the user, None otherwise
+        """
+        stmt = select(Project).where(Project.id == project_id, Project.user_id == self.user.id)
+        if with_sources:
+            stmt = stmt.options(selectinload(Project.sources))
+        result = await self.session.execute(stmt)
+        return result.scalar_one_or_none()
 
     # ==================== SESSION MANAGEMENT ====================
 
@@ -66,34 +167,43 @@ class ProjectChatService(BaseChatService):
         if not project:
             return []
         
-        # Subquery to count messages per session
-        message_count_subq = (
-            select(func.count(ProjectChatMessage.id))
-            .where(ProjectChatMessage.session_id == ProjectChatSession.id)
-            .correlate(ProjectChatSession)
-            .scalar_subquery()
-        )
-        
+        # Count messages per session in one aggregate pass
         result = await self.session.execute(
-            select(ProjectChatSession, message_count_subq.label("message_count"))
+            select(ProjectChatSession, func.count(ProjectChatMessage.id).label("message_count"))
+            .outerjoin(ProjectChatMessage, ProjectChatMessage.session_id == ProjectChatSession.id)
             .where(ProjectChatSession.project_id == project_id)
+            .group_by(ProjectChatSession.id)
             .order_by(ProjectChatSession.updated_at.desc())
         )
         return list(result.all())
 
-    async def get_session(self, session_id: int) -> ProjectChatSession | None:
-        """Get a specific chat session."""
-        result = await self.session.execute(
+    async def get_session(
+        self, session_id: int, *, with_messages: bool = False
+    ) -> ProjectChatSession | None:
+        """Get a specific chat session.
+
+        Ownership is checked in the same query by joining the project.
+
+        Args:
+            session_id: ID of the chat session
+            with_messages: Preload the session's messages (needed to
+                delete it, since the ORM cascades to them)
+
+        Returns:
+            Session if found and owned by the user, None otherwise
+        """
+        stmt = (
             select(ProjectChatSession)
-            .options(selectinload(ProjectChatSession.messages))
-            .where(ProjectChatSession.id == session_id)
+            .join(Project, Project.id == ProjectChatSession.project_id)
+            .where(
+                ProjectChatSession.id == session_id,
+                Project.user_id == self.user.id,
+            )
         )
-        session_obj = result.scalar_one_or_none()
-        if session_obj:
-            project = await self.get_project(session_obj.project_id)
-            if not project:
-                return None
-        return session_obj
+        if with_messages:
+            stmt = stmt.options(selectinload(ProjectChatSession.messages))
+        result = await self.session.execute(stmt)
+        return result.scalar_one_or_none()
 
     async def create_session(self, project_id: int, title: str = "Nouvelle conversation") -> ProjectChatSession:
         """Create a new chat session for a project."""
@@ -114,7 +224,7 @@ class ProjectChatService(BaseChatService):
 
     async def delete_session(self, session_id: int) -> bool:
         """Delete a chat session and all its messages."""
-        session_obj = await self.get_session(session_id)
+        session_obj = await self.get_session(session_id, with_messages=True)
         if not session_obj:
             return False
         await self.session.delete(session_obj)
@@ -143,39 +253,34 @@ class ProjectChatService(BaseChatService):
             return "Nouvelle conversation"  # Fallback if no API key
         client = Mistral(api_key=api_key)
         
-        prompt = f"""Génère un titre TRÈS CONCIS (5-7 mots maximum) pour cette conversation.
-Le titre doit capturer le sujet principal de la discussion.
-
-RÈGLES STRICTES:
-- PAS de guillemets autour du titre
-- PAS de markdown (pas de #, *, _, **, etc.)
-- PAS d'emojis
-- PAS de ponctuation spéciale
-- Texte simple uniquement
-
-Réponds UNIQUEMENT avec le titre, rien d'autre.
-
-Question: {user_message[:500]}
-Réponse: {assistant_response[:500]}
-
-Titre:"""
+        prompt = (
+            "Titre TRÈS CONCIS (5-7 mots, texte simple : sans guillemets, markdown "
+            "ni emojis) du sujet de cette conversation. "
+            'Réponds en JSON : {"title": "..."}\n\n'
+            f"Question: {user_message[:300]}\n"
+            f"Réponse: {assistant_response[:300]}"
+        )
 
         try:
             response = await client.chat.complete_async(
                 model="ministral-3b-latest",
                 messages=[{"role": "user", "content": prompt}],
+                response_format={"type": "json_object"},
                 temperature=0.3,
-                max_tokens=30,
+                max_tokens=40,
             )
             
             if response.choices and response.choices[0].message.content:
-                title = response.choices[0].message.content.strip()
-                # Clean up any quotes
-                title = title.strip('"\'')
+                content = response.choices[0].message.content
+                try:
+                    title = str(json.loads(content).get("title", "")).strip()
+                except (ValueError, AttributeError):
+                    title = content.strip().strip('"\'')  # Not JSON after all
                 # Truncate if too long
                 if len(title) > 100:
                     title = title[:97] + "..."
-                return title
+                if title:
+                    return title
         except Exception as exc:
             logger.error("Error generating session title", exc_info=exc)
         
@@ -191,26 +296,52 @@ Titre:"""
         Returns:
             True if update was successful
         """
-        session_obj = await self.get_session(session_id)
-        if not session_obj:
-            return False
-        
-        session_obj.title = title
-        session_obj.updated_at = datetime.now(tz=UTC)
+        owned_projects = select(Project.id).where(Project.user_id == self.user.id)
+        result = await self.session.execute(
+            update(ProjectChatSession)
+            .where(
+                ProjectChatSession.id == session_id,
+                ProjectChatSession.project_id.in_(owned_projects),
+            )
+            .values(title=title, updated_at=datetime.now(tz=UTC))
+        )
         await self.session.commit()
-        return True
+        return result.rowcount > 0
 
-    async def get_session_history(self, session_id: int) -> list[ProjectChatMessage]:
-        """Get messages for a specific session."""
-        session_obj = await self.get_session(session_id)
-        if not session_obj:
-            return []
-        result = await self.session.execute(
+    async def get_session_history(
+        self, session_id: int, limit: int | None = None
+    ) -> list[ProjectChatMessage]:
+        """Get messages for a specific session, oldest first.
+
+        A single query: ownership is checked by joining the session's
+        project, so a foreign or missing session yields an empty list.
+
+        Args:
+            session_id: ID of the chat session
+            limit: Only return the most recent `limit` messages
+
+        Returns:
+            Messages in chronological order
+        """
+        stmt = (
             select(ProjectChatMessage)
-            .where(ProjectChatMessage.session_id == session_id)
-            .order_by(ProjectChatMessage.created_at.asc())
+            .join(ProjectChatSession, ProjectChatSession.id == ProjectChatMessage.session_id)
+            .join(Project, Project.id == ProjectChatSession.project_id)
+            .where(
+                ProjectChatMessage.session_id == session_id,
+                Project.user_id == self.user.id,
+            )
         )
-        return list(result.scalars().all())
+        if limit is None:
+            stmt = stmt.order_by(ProjectChatMessage.created_at.asc(), ProjectChatMessage.id.asc())
+            result = await self.session.execute(stmt)
+            return list(result.scalars().all())
+
+        stmt = stmt.order_by(
+            ProjectChatMessage.created_at.desc(), ProjectChatMessage.id.desc()
+        ).limit(limit)
+        result = await self.session.execute(stmt)
+        return list(reversed(result.scalars().all()))
 
     # ==================== CHAT ====================
 
@@ -225,19 +356,31 @@ Titre:"""
         session_id: int | None = None
     ) -> AsyncIterator[str]:
         """Send a message and stream the AI response."""
-        project = await self.get_project(project_id)
-        if not project:
-            raise ValueError("Project not found or access denied")
-
-        # Check API key availability (user's own or demo)
+        # Check API key availability (user's own or demo) first: it needs no
+        # database round trip
         from app.services.api_key_resolver import get_effective_api_key_sync
         if not get_effective_api_key_sync(self.user):
             raise ValueError("API key not configured and no active demo access")
 
+        project = await self.get_project(project_id, with_sources=True)
+        if not project:
+            raise ValueError("Project not found or access denied")
+
         # Filter sources if source_ids provided
         sources = list(project.sources)
         if source_ids:
-            sources = [s for s in sources if s.id in source_ids]
+            selected = [s for s in sources if s.id in source_ids]
+            # A strict subset is indexed under its own collection; the
+            # whole project shares the prewarmed one
+            if len(selected) < len(sources):
+                self._source_ids = tuple(s.id for s in selected)
+            sources = selected
+
+        # Get recent history before saving the new message, so it's excluded
+        if session_id:
+            history = await self.get_session_history(session_id, limit=MAX_HISTORY_MESSAGES)
+        else:
+            history = []
 
         # Save user message
         user_msg = ProjectChatMessage(
@@ -252,20 +395,13 @@ Titre:"""
             } if action or selected_text or source_ids else None,
             created_at=datetime.now(tz=UTC)
         )
+        # Inserted together with the assistant reply at the final commit
         self.session.add(user_msg)
-        await self.session.flush()
 
         # Index sources for RAG
         if sources:
             embedding_svc = self._get_embedding_service()
-            await embedding_svc.index_project_sources(project_id, sources)
-
-        # Get recent history
-        if session_id:
-            history = await self.get_session_history(session_id)
-        else:
-            history = []
-        history = [h for h in history if h.id != user_msg.id][-MAX_HISTORY_MESSAGES:]
+            await embedding_svc.index_project_sources(project_id, sources, self._source_ids)
 
         # Build messages for Mistral
         messages = self._build_messages(project, sources, history, message, action, selected_text)
@@ -273,88 +409,104 @@ Titre:"""
         logger.debug("Starting RAG flow for project %d with %d sources", project_id, len(sources))
 
         # Agentic loop - capture sources for saving (accumulate across all searches)
-        full_response = ""
+        response_parts: list[str] = []
         all_sources_used: list[str] = []
         all_chunks_found: list[dict] = []
+        sources_seen: set[str] = set()
+        chunks_seen: set[str] = set()
         
         async for chunk in self._agentic_loop(project_id, messages):
-            if chunk.startswith("[EVENT:search_complete:"):
-                try:
-                    payload_str = chunk[23:-1]
-                    payload = json.loads(payload_str)
+            if not chunk.startswith(EVENT_PREFIX):
+                # Text token, the common case: a single prefix check
+                response_parts.append(chunk)
+            elif chunk.startswith(SEARCH_COMPLETE_EVENT):
+                payload = self.parse_search_complete(chunk)
+                if payload is not None:
                     new_sources = payload.get("sources", [])
                     new_chunks = payload.get("chunks", [])
                     
                     # Accumulate sources (deduplicate by name)
                     for src in new_sources:
-                        if src not in all_sources_used:
+                        if src not in sources_seen:
+                            sources_seen.add(src)
                             all_sources_used.append(src)
                     
-                    # Accumulate chunks (deduplicate by content prefix)
+                    # Accumulate chunks (deduplicate by content; the set holds
+                    # references to the payload strings, whose hash is cached)
                     # Use 'content' field (new format) or fall back to 'preview' (old format)
-                    existing_contents = {
-                        c.get("content", c.get("preview", ""))[:100] 
-                        for c in all_chunks_found
-                    }
                     for chunk_data in new_chunks:
                         chunk_content = chunk_data.get("content", chunk_data.get("preview", ""))
-                        if chunk_content[:100] not in existing_contents:
+                        if chunk_content not in chunks_seen:
+                            chunks_seen.add(chunk_content)
                             all_chunks_found.append(chunk_data)
-                            existing_contents.add(chunk_content[:100])
-                except Exception:
-                    pass
-            elif not chunk.startswith("[EVENT:"):
-                full_response += chunk
             yield chunk
 
-        clean_response = self.clean_response(full_response)
+        clean_response = self.clean_response("".join(response_parts))
 
         logger.debug(
             "RAG flow completed: %d sources used, %d chunks found",
             len(all_sources_used), len(all_chunks_found)
         )
 
-        # Save assistant response
-        assistant_metadata = None
-        if all_sources_used or all_chunks_found:
-            assistant_metadata = {
-                "sources_used": all_sources_used,
-                "chunks_found": all_chunks_found
-            }
-            logger.info("RAG metadata being saved", extra={
-                "sources_count": len(all_sources_used),
-                "chunks_count": len(all_chunks_found),
-                "chunk_previews": [c.get("content", "")[:100] for c in all_chunks_found[:3]]
-            })
+        # Generate title after first exchange (when history was empty before
+        # this message). Start the Mistral call now so it overlaps saving
+        # the response; it doesn't touch the database session.
+        title_task: asyncio.Task[str] | None = None
+        if session_id and len(history) == 0 and clean_response.strip():
+            title_task = asyncio.create_task(
+                self._generate_session_title(message, clean_response)
+            )
 
-        assistant_msg = ProjectChatMessage(
-            project_id=project_id,
-            session_id=session_id,
-            role="assistant",
-            content=clean_response.strip(),
-            message_metadata=assistant_metadata,
-            created_at=datetime.now(tz=UTC)
-        )
-        self.session.add(assistant_msg)
-        await self.session.commit()
+        try:
+            # Save assistant response
+            assistant_metadata = None
+            if all_sources_used or all_chunks_found:
+                assistant_metadata = {
+                    "sources_used": all_sources_used,
+                    "chunks_found": all_chunks_found
+                }
+                logger.info("RAG metadata being saved", extra={
+                    "sources_count": len(all_sources_used),
+                    "chunks_count": len(all_chunks_found),
+                })
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("RAG chunk previews: %r", [
+                        c.get("content", "")[:100] for c in all_chunks_found[:3]
+                    ])
+
+            assistant_msg = ProjectChatMessage(
+                project_id=project_id,
+                session_id=session_id,
+                role="assistant",
+                content=clean_response.strip(),
+                message_metadata=assistant_metadata,
+                created_at=datetime.now(tz=UTC)
+            )
+            self.session.add(assistant_msg)
+            await self.session.commit()
 
-        # Generate title after first exchange (when history was empty before this message)
-        if session_id and len(history) == 0 and clean_response.strip():
-            try:
-                new_title = await self._generate_session_title(message, clean_response)
-                if new_title and new_title != "Nouvelle conversation":
-                    await self._update_session_title(session_id, new_title)
-                    yield f'[EVENT:title_generated:{json.dumps({"session_id": session_id, "title": new_title})}]'
-            except Exception as exc:
-                logger.error("Error in title generation", exc_info=exc)
-                # Don't fail the message if title generation fails
+            if title_task is not None:
+                try:
+                    new_title = await title_task
+                    if new_title and new_title != "Nouvelle conversation":
+                        await self._update_session_title(session_id, new_title)
+                        yield f'[EVENT:title_generated:{json.dumps({"session_id": session_id, "title": new_title})}]'
+                except Exception as exc:
+                    logger.error("Error in title generation", exc_info=exc)
+                    # Don't fail the message if title generation fails
+        finally:
+            # Client went away before the title came back
+            if title_task is not None and not title_task.done():
+                title_task.cancel()
 
     async def _search_sources(self, project_id: int, query: str) -> tuple[str, list[str], list[dict]]:
         """Execute search in project sources."""
         embedding_svc = self._get_embedding_service()
         
         try:
-            results = await embedding_svc.search_project(project_id, query, top_k=3)
+            results = await embedding_svc.search_project(
+                project_id, query, top_k=3, source_ids=self._source_ids
+            )
         except Exception as exc:
             logger.error("Error searching project sources", exc_info=exc)
             return "Erreur lors de la recherche dans les sources.", [], []
@@ -372,25 +524,9 @@ Titre:"""
     ) -> list[dict[str, Any]]:
         """Build message list for Mistral API."""
         
-        source_summary = ", ".join([s.title for s in sources[:10]])
-        if len(sources) > 10:
-            source_summary += f" (et {len(sources) - 10} autres)"
-        
-        system_prompt = f"""Tu es un assistant pédagogique pour un étudiant consultant ses sources de projet.
-
-PROJET: {project.title}
-SOURCES DISPONIBLES: {source_summary}
-
-RÈGLES IMPORTANTES:
-1. Si l'utilisateur pose une QUESTION sur le contenu → UTILISE L'OUTIL search_sources
-2. Si l'utilisateur dit "bonjour", "merci", ou fait la conversation → réponds normalement SANS utiliser l'outil
-3. Quand tu utilises l'outil, base ta réponse sur les extraits retournés
-
-STYLE DE RÉPONSE:
-- Sois CONCIS: 1-3 paragraphes maximum
-- Réponds en français
-- NE CITE JAMAIS les sources dans ta réponse (affichées automatiquement par l'interface)
-"""
+        system_prompt = _project_system_prompt(
+            project.title, tuple(s.title for s in sources[:10]), len(sources)
+        )
 
         messages: list[dict[str, Any]] = [
             {"role": "system", "content": system_prompt}
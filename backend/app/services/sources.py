@@ -1,18 +1,29 @@
 from __future__ import annotations
 
 import logging
+import os
+from collections.abc import Iterable
 from pathlib import Path
 
 from fastapi import HTTPException, status
+from fastapi.responses import FileResponse
+from pydantic import TypeAdapter
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models import Project, Source, SourceType, User
 from app.schemas import SourceCreate, SourceDetail, SourceRead, SourceUpdate
+from app.utils.audio import AUDIO_MIME_BY_EXTENSION
 from app.utils.db import save_and_refresh
 from app.utils.errors import raise_invalid_request, raise_not_found, raise_resource_unavailable
 from app.utils.tokens import estimate_tokens
 
+# Shared list validator for list_sources and project detail views
+_SOURCE_LIST = TypeAdapter(list[SourceRead])
+
+# Rows fetched per round of a streamed source listing
+SOURCE_BATCH_SIZE = 100
+
 
 class SourceNotFoundError(HTTPException):
     """Raised when a source is not found."""
@@ -68,11 +79,16 @@ class SourceService:
             select(Source)
             .where(Source.project_id == project_id)
             .order_by(Source.created_at)
+            .execution_options(yield_per=SOURCE_BATCH_SIZE)
         )
-        result = await self.session.execute(stmt)
-        sources = result.scalars().all()
-        
-        return [self._to_source_read(source) for source in sources]
+        # Stream rows in batches and convert each one as it arrives, so the
+        # ORM rows of large projects (with their processed text) don't all
+        # sit in memory at once
+        result = await self.session.stream_scalars(stmt)
+        sources: list[SourceRead] = []
+        async for batch in result.partitions():
+            sources.extend(self._to_source_reads(batch))
+        return sources
     
     async def get_source(self, project_id: int, source_id: int) -> SourceDetail:
         """Get detailed information about a source."""
@@ -87,12 +103,11 @@ class SourceService:
         # Delete file on disk if present
         if source.file_path:
             file_path = Path(source.file_path)
-            if file_path.exists():
-                try:
-                    file_path.unlink()
-                except OSError as exc:
-                    # Log but don't block DB deletion
-                    logging.warning(f"Failed to delete file {file_path}: {exc}")
+            try:
+                file_path.unlink(missing_ok=True)
+            except OSError as exc:
+                # Log but don't block DB deletion
+                logging.warning(f"Failed to delete file {file_path}: {exc}")
         
         await self.session.delete(source)
         await self.session.commit()
@@ -143,19 +158,22 @@ class SourceService:
         if not source.file_path:
             raise_resource_unavailable("Source file", "no file path set")
         file_path = Path(source.file_path)
-        if not file_path.exists():
+        # One stat both checks the file and is handed to FileResponse,
+        # which would otherwise stat it again. Any OSError (missing file,
+        # permissions) is reported as unavailable, as Path.exists() did.
+        try:
+            stat_result = os.stat(file_path)
+        except OSError:
             raise_resource_unavailable("Source file", "file not found on disk")
-        # Infer media type
-        ext = file_path.suffix.lower()
-        media_types = {
-            ".mp3": "audio/mpeg",
-            ".wav": "audio/wav",
-            ".webm": "audio/webm",
-            ".m4a": "audio/mp4",
-        }
-        media_type = media_types.get(ext, "application/octet-stream")
-        from fastapi.responses import FileResponse
-        return FileResponse(path=str(file_path), media_type=media_type, filename=file_path.name)
+        media_type = AUDIO_MIME_BY_EXTENSION.get(
+            file_path.suffix.lower().lstrip("."), "application/octet-stream"
+        )
+        return FileResponse(
+            path=str(file_path),
+            media_type=media_type,
+            filename=file_path.name,
+            stat_result=stat_result,
+        )
     
     async def _get_project(self, project_id: int) -> Project:
         """Get project and verify ownership."""
@@ -170,16 +188,21 @@ class SourceService:
     
     async def _get_source_with_ownership(self, project_id: int, source_id: int) -> Source:
         """Get source and verify project ownership."""
-        await self._get_project(project_id)
-        
         stmt = (
             select(Source)
-            .where(Source.id == source_id, Source.project_id == project_id)
+            .join(Project, Source.project_id == Project.id)
+            .where(
+                Source.id == source_id,
+                Source.project_id == project_id,
+                Project.user_id == self.user.id,
+            )
         )
         result = await self.session.execute(stmt)
         source = result.scalars().first()
         
         if not source:
+            # Only on the miss path: a missing project keeps its own 404
+            await self._get_project(project_id)
             raise SourceNotFoundError(source_id)
         
         return source
@@ -187,15 +210,27 @@ class SourceService:
     @staticmethod
     def _to_source_read(source: Source) -> SourceRead:
         """Convert Source model to SourceRead schema."""
-        return SourceRead(
-            id=source.id,
-            type=source.type,
-            status=source.status,
-            title=source.title,
-            created_at=source.created_at,
-            processed_content=source.processed_content,
-            audio_metadata=source.audio_metadata,
-            document_metadata=source.document_metadata,
-            youtube_metadata=source.youtube_metadata,
-            content=source.content if source.type == SourceType.DOCUMENT else None,
+        return SourceRead.model_validate(SourceService._source_fields(source))
+
+    @staticmethod
+    def _to_source_reads(sources: Iterable[Source]) -> list[SourceRead]:
+        """Convert Source models to SourceRead schemas in one validation pass."""
+        return _SOURCE_LIST.validate_python(
+            [SourceService._source_fields(source) for source in sources]
         )
+
+    @staticmethod
+    def _source_fields(source: Source) -> dict:
+        """SourceRead fields of a Source (content is only exposed for documents)."""
+        return {
+            "id": source.id,
+            "type": source.type,
+            "status": source.status,
+            "title": source.title,
+            "created_at": source.created_at,
+            "processed_content": source.processed_content,
+            "audio_metadata": source.audio_metadata,
+            "document_metadata": source.document_metadata,
+            "youtube_metadata": source.youtube_metadata,
+            "content": source.content if source.type == SourceType.DOCUMENT else None,
+        }
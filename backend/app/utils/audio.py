@@ -1,11 +1,16 @@
 from __future__ import annotations
 
-import subprocess
+import asyncio
+import os
+import re
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import BinaryIO
 
 from mutagen import File as MutagenFile
+from mutagen.mp3 import MP3
+from mutagen.mp4 import MP4
+from mutagen.wave import WAVE
 
 from app.core.settings import settings
 
@@ -23,6 +28,19 @@ SUPPORTED_AUDIO_MIME_TYPES = {
 
 SUPPORTED_EXTENSIONS = {".webm", ".wav", ".mp3", ".m4a"}
 
+# MIME type for each stored audio extension (used to pick a processor)
+AUDIO_MIME_BY_EXTENSION = {
+    "mp3": "audio/mpeg",
+    "wav": "audio/wav",
+    "webm": "audio/webm",
+    "m4a": "audio/mp4",
+    "aac": "audio/aac",
+}
+DEFAULT_AUDIO_MIME_TYPE = "audio/mpeg"
+
+# ffmpeg progress lines report encoded output time as "time=HH:MM:SS.xx"
+_FFMPEG_TIME_RE = re.compile(rb"time=(\d+):(\d{2}):(\d{2}(?:\.\d+)?)")
+
 
 def ensure_within_limits(size_bytes: int) -> None:
     if size_bytes > settings.max_audio_bytes:
@@ -35,8 +53,12 @@ def ensure_supported_extension(filename: str) -> None:
         raise ValueError("Unsupported audio file extension")
 
 
+# \w is str.isalnum() plus "_", so accented letters in filenames are kept
+_UNSAFE_FILENAME_CHARS = re.compile(r"[^\w.-]")
+
+
 def sanitize_filename(name: str) -> str:
-    return "".join(ch if ch.isalnum() or ch in {"-", "_", "."} else "_" for ch in name)
+    return _UNSAFE_FILENAME_CHARS.sub("_", name)
 
 
 def generate_upload_filename(original_name: str, *, prefix: str = "upload") -> str:
@@ -45,10 +67,20 @@ def generate_upload_filename(original_name: str, *, prefix: str = "upload") -> s
     return f"{prefix}-{timestamp}-{sanitized}"
 
 
+# Stored audio formats map straight to their mutagen parser, which skips the
+# format sniffing that mutagen.File() does by trying every known type
+_MUTAGEN_BY_EXTENSION = {
+    ".mp3": MP3,
+    ".wav": WAVE,
+    ".m4a": MP4,
+}
+
+
 def compute_duration_seconds(path: Path) -> int:
     """Compute audio duration using mutagen (works for MP3, WAV, M4A)."""
     try:
-        audio = MutagenFile(str(path))
+        parser = _MUTAGEN_BY_EXTENSION.get(path.suffix.lower())
+        audio = parser(str(path)) if parser else MutagenFile(str(path))
         if audio is None or not audio.info or not hasattr(audio.info, 'length'):
             raise ValueError("Unable to determine audio duration")
         return int(audio.info.length)
@@ -56,25 +88,57 @@ def compute_duration_seconds(path: Path) -> int:
         raise ValueError(f"Invalid audio file: {str(exc)}") from exc
 
 
-def convert_webm_to_mp3(input_path: Path, output_path: Path) -> None:
-    """Convert WebM audio to MP3 using ffmpeg."""
-    result = subprocess.run(
-        [
+# Output options for WebM -> MP3, built once rather than per conversion
+_WEBM_TO_MP3_OPTIONS = (
+    "-vn",  # No video
+    "-ar", "44100",  # Sample rate
+    "-ac", "2",  # Stereo
+    "-b:a", "192k",  # Bitrate
+    "-threads", "0",  # Let ffmpeg use every core
+    "-y",  # Overwrite output file
+)
+
+# Each ffmpeg already spreads over all cores; cap how many run side by side
+# so a burst of uploads doesn't have them all fighting for CPU
+FFMPEG_MAX_CONCURRENCY = min(4, os.cpu_count() or 1)
+_ffmpeg_slots = asyncio.Semaphore(FFMPEG_MAX_CONCURRENCY)
+
+
+async def convert_webm_to_mp3(input_path: Path, output_path: Path) -> int | None:
+    """Convert WebM audio to MP3 using ffmpeg.
+
+    Runs ffmpeg as an async subprocess so the event loop keeps serving other
+    requests while it encodes. At most FFMPEG_MAX_CONCURRENCY conversions run
+    at once; further uploads wait for a slot.
+
+    Returns the encoded duration in seconds, read from ffmpeg's own progress
+    output, so callers don't need to probe the MP3 again. Returns None if
+    ffmpeg didn't report it.
+    """
+    async with _ffmpeg_slots:
+        proc = await asyncio.create_subprocess_exec(
             "ffmpeg",
             "-i", str(input_path),
-            "-vn",  # No video
-            "-ar", "44100",  # Sample rate
-            "-ac", "2",  # Stereo
-            "-b:a", "192k",  # Bitrate
-            "-y",  # Overwrite output file
-            str(output_path)
-        ],
-        capture_output=True,
-        timeout=60
-    )
-    
-    if result.returncode != 0:
-        raise ValueError(f"Failed to convert WebM to MP3: {result.stderr.decode()}")
+            *_WEBM_TO_MP3_OPTIONS,
+            str(output_path),
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        try:
+            _, stderr = await asyncio.wait_for(proc.communicate(), timeout=60)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            raise ValueError("Failed to convert WebM to MP3: ffmpeg timed out")
+
+    if proc.returncode != 0:
+        raise ValueError(f"Failed to convert WebM to MP3: {stderr.decode()}")
+
+    matches = _FFMPEG_TIME_RE.findall(stderr)
+    if not matches:
+        return None
+    hours, minutes, seconds = matches[-1]
+    return int(int(hours) * 3600 + int(minutes) * 60 + float(seconds))
 
 
 def user_project_storage_path(user_id: int, project_id: int) -> Path:
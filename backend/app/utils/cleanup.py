@@ -1,7 +1,9 @@
 """Utility functions for cleaning up temporary files."""
 
+import asyncio
 import logging
-from datetime import UTC, datetime, timedelta
+import os
+import time
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
@@ -21,22 +23,32 @@ def cleanup_temp_files(temp_dir: Path, max_age_hours: int = 24) -> int:
         logger.debug("Temp directory does not exist", extra={"dir": str(temp_dir)})
         return 0
     
-    cutoff = datetime.now(tz=UTC) - timedelta(hours=max_age_hours)
+    cutoff = time.time() - max_age_hours * 3600
     deleted = 0
     
-    for file_path in temp_dir.rglob("*"):
-        if not file_path.is_file():
-            continue
-        
+    # Iterative scandir walk: DirEntry caches the type and stat results, so
+    # each entry costs at most one stat() call and no Path objects
+    stack = [str(temp_dir)]
+    while stack:
         try:
-            mtime = datetime.fromtimestamp(file_path.stat().st_mtime, tz=UTC)
-            if mtime < cutoff:
-                file_path.unlink()
-                deleted += 1
-                logger.debug("Deleted temp file", extra={"file": str(file_path)})
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.is_file() and entry.stat().st_mtime < cutoff:
+                            os.unlink(entry.path)
+                            deleted += 1
+                            logger.debug("Deleted temp file", extra={"file": entry.path})
+                    except OSError as exc:
+                        logger.warning("Failed to delete temp file", extra={"file": entry.path, "error": str(exc)})
         except OSError as exc:
-            logger.warning("Failed to delete temp file", extra={"file": str(file_path), "error": str(exc)})
+            logger.warning("Failed to scan temp directory", extra={"error": str(exc)})
     
     logger.info("Temp files cleanup completed", extra={"deleted": deleted, "dir": str(temp_dir)})
     return deleted
 
+
+async def cleanup_temp_files_async(temp_dir: Path, max_age_hours: int = 24) -> int:
+    """Run cleanup_temp_files in a worker thread, off the event loop."""
+    return await asyncio.to_thread(cleanup_temp_files, temp_dir, max_age_hours)
@@ -2,22 +2,32 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 
 
-async def save_and_refresh(session: AsyncSession, entity):
+async def save_and_refresh(
+    session: AsyncSession,
+    entity,
+    attribute_names: list[str] | None = None,
+):
     """
-    Add entity to session, commit, and refresh.
+    Add entity to session, commit, and refresh what the INSERT didn't return.
 
-    This utility consolidates the common pattern of adding an entity,
-    committing the transaction, and refreshing to load any DB-generated
-    values (like auto-increment IDs, timestamps, etc.).
+    This utility consolidates the common pattern of adding an entity and
+    committing the transaction. The auto-increment ID comes back from the
+    INSERT itself, Python-side column defaults are set on the instance at
+    flush, and sessions use expire_on_commit=False, so no follow-up SELECT
+    is needed by default. Models with server-generated columns should set
+    eager_defaults (see ProcessingJob) to have them returned by the INSERT.
 
     Args:
         session: Database session
         entity: SQLAlchemy model instance to persist
+        attribute_names: Columns to reload from the database after commit,
+            for values the INSERT can't return
 
     Returns:
-        The refreshed entity with all DB-generated values populated
+        The persisted entity with all DB-generated values populated
     """
     session.add(entity)
     await session.commit()
-    await session.refresh(entity)
+    if attribute_names:
+        await session.refresh(entity, attribute_names=attribute_names)
     return entity
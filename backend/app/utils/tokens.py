@@ -38,12 +38,33 @@ def estimate_tokens(text: str) -> int:
     Performance:
         - ~1ms for 10k tokens on modern hardware
         - Encoding is cached for repeated calls
+        - encode_ordinary skips the special-token scan (and never raises
+          on text that happens to contain e.g. "<|endoftext|>")
     """
     if not text:
         return 0
     
     encoding = get_encoding()
-    return len(encoding.encode(text))
+    return len(encoding.encode_ordinary(text))
+
+
+def estimate_tokens_each(texts: Sequence[str]) -> list[int]:
+    """
+    Estimate token count for each of several texts in one batch.
+    
+    tiktoken encodes the batch on a thread pool in Rust, outside the GIL.
+    
+    Args:
+        texts: Sequence of texts to count tokens for
+        
+    Returns:
+        Estimated token count per text, in input order
+    """
+    if not texts:
+        return []
+    
+    encoding = get_encoding()
+    return [len(tokens) for tokens in encoding.encode_ordinary_batch(list(texts))]
 
 
 def estimate_tokens_batch(texts: Sequence[str]) -> int:
@@ -56,7 +77,7 @@ def estimate_tokens_batch(texts: Sequence[str]) -> int:
     Returns:
         Total estimated token count across all texts
     """
-    return sum(estimate_tokens(text) for text in texts)
+    return sum(estimate_tokens_each(texts))
 
 
 def format_token_count(count: int) -> str:
@@ -0,0 +1,9 @@
+"""Background job workers."""
+
+from .queue import JobQueue, generation_queue, processing_queue
+
+__all__ = [
+    "JobQueue",
+    "processing_queue",
+    "generation_queue",
+]
@@ -0,0 +1,169 @@
+"""In-process job queues for long-running background work.
+
+Transcription and document generation used to run as FastAPI
+BackgroundTasks, one task per request with no upper bound. Routes now
+enqueue jobs on a named queue that a fixed pool of worker tasks drains, so a
+burst of uploads can't have dozens of multi-minute jobs running at once, and
+processing and generation get separate capacity.
+
+On shutdown the queues drain for up to
+`settings.job_queue_shutdown_timeout_seconds`; jobs still running or waiting
+after that are cancelled and their project's job row is marked FAILED, so
+the project doesn't stay PENDING (and refuse new jobs) forever.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from typing import TYPE_CHECKING, Any
+
+from app.core.settings import settings
+from app.models import JobStatus
+
+if TYPE_CHECKING:
+    from app.services.base_job import BaseJobService
+
+logger = logging.getLogger(__name__)
+
+JobFunc = Callable[..., Awaitable[None]]
+# Called with the project ID of a job dropped or cancelled at shutdown
+AbandonedHook = Callable[[int], Awaitable[None]]
+
+SHUTDOWN_ERROR = "Interrupted by a server restart, please try again"
+
+
+class JobQueue:
+    """FIFO queue of coroutine jobs drained by `concurrency` worker tasks.
+
+    Workers are started lazily on the running event loop at the first
+    enqueue (and restarted if the loop changed, e.g. between test cases).
+    Every job belongs to a project; `on_abandoned` is awaited with the
+    project ID of each job that `stop` drops or cancels.
+    """
+
+    def __init__(self, name: str, concurrency: int, on_abandoned: AbandonedHook | None = None):
+        self.name = name
+        self.concurrency = concurrency
+        self.on_abandoned = on_abandoned
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._queue: asyncio.Queue[tuple[JobFunc, tuple[Any, ...], dict[str, Any]]] | None = None
+        self._workers: list[asyncio.Task[None]] = []
+        # worker task -> project ID of the job it is running
+        self._running: dict[asyncio.Task[None], int] = {}
+
+    def enqueue(self, func: JobFunc, project_id: int, *args: Any, **kwargs: Any) -> None:
+        """Schedule `func(project_id, *args, **kwargs)` to run on a worker.
+
+        Must be called from within the event loop (e.g. a route handler).
+        """
+        self._ensure_started()
+        assert self._queue is not None
+        self._queue.put_nowait((func, (project_id, *args), kwargs))
+        logger.info("Job enqueued", extra={
+            "queue": self.name,
+            "job": getattr(func, "__name__", repr(func)),
+            "pending": self._queue.qsize(),
+        })
+
+    async def stop(self, timeout: float | None = None) -> None:
+        """Let the workers drain the queue, then cancel what is left.
+
+        Jobs still running or waiting after `timeout` seconds (default
+        `settings.job_queue_shutdown_timeout_seconds`) are cancelled or
+        dropped and reported to `on_abandoned`.
+        """
+        if timeout is None:
+            timeout = settings.job_queue_shutdown_timeout_seconds
+        queue, workers = self._queue, self._workers
+        if queue is not None and workers:
+            try:
+                await asyncio.wait_for(queue.join(), timeout)
+            except TimeoutError:
+                logger.warning("Job queue not drained before shutdown", extra={
+                    "queue": self.name,
+                    "running": len(self._running),
+                    "pending": queue.qsize(),
+                })
+
+        abandoned = list(self._running.values())
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        while queue is not None and not queue.empty():
+            _, args, _ = queue.get_nowait()
+            abandoned.append(args[0])
+        self._workers = []
+        self._running = {}
+        self._queue = None
+        self._loop = None
+
+        if self.on_abandoned is not None:
+            for project_id in abandoned:
+                try:
+                    await self.on_abandoned(project_id)
+                except Exception:
+                    logger.exception("Could not mark abandoned job as failed", extra={
+                        "queue": self.name,
+                        "project_id": project_id,
+                    })
+
+    def _ensure_started(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is loop and self._workers:
+            return
+        self._loop = loop
+        self._queue = asyncio.Queue()
+        self._workers = [
+            loop.create_task(self._work(self._queue), name=f"{self.name}-worker-{i}")
+            for i in range(self.concurrency)
+        ]
+
+    async def _work(self, queue: asyncio.Queue) -> None:
+        worker = asyncio.current_task()
+        assert worker is not None
+        while True:
+            func, args, kwargs = await queue.get()
+            self._running[worker] = args[0]
+            try:
+                await func(*args, **kwargs)
+            except Exception:
+                logger.exception("Background job failed", extra={
+                    "queue": self.name,
+                    "job": getattr(func, "__name__", repr(func)),
+                })
+            finally:
+                self._running.pop(worker, None)
+                queue.task_done()
+
+
+async def _fail_abandoned_job(job_service_class: type[BaseJobService], project_id: int) -> None:
+    """Mark a project's job FAILED unless it already finished."""
+    # Imported here: tests reload the session module
+    from app.db import session as db_session
+    async with db_session.WorkerSessionLocal() as session:
+        job_svc = job_service_class(session)
+        job = await job_svc.get_job_by_project(project_id)
+        if job is None or job.status not in (JobStatus.PENDING, JobStatus.IN_PROGRESS):
+            return
+        await job_svc.mark_failed(job.id, SHUTDOWN_ERROR)
+        await session.commit()
+
+
+async def _fail_processing_job(project_id: int) -> None:
+    from app.services.processing_job import ProcessingJobService
+    await _fail_abandoned_job(ProcessingJobService, project_id)
+
+
+async def _fail_generation_job(project_id: int) -> None:
+    from app.services.generation_job import GenerationJobService
+    await _fail_abandoned_job(GenerationJobService, project_id)
+
+
+processing_queue = JobQueue(
+    "processing", settings.processing_queue_workers, on_abandoned=_fail_processing_job
+)
+generation_queue = JobQueue(
+    "generation", settings.generation_queue_workers, on_abandoned=_fail_generation_job
+)
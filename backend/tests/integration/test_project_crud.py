@@ -8,6 +8,8 @@ Tests cover:
 - Project update
 - Project deletion with cascade
 """
+import json
+
 import pytest
 from httpx import AsyncClient
 
@@ -154,6 +156,52 @@ class TestProjectListing:
         data2 = response2.json()
         assert len(data2["items"]) == 5
 
+    async def test_list_projects_cursor_pagination(
+        self, authenticated_client: tuple[AsyncClient, dict]
+    ):
+        """Verify cursor pagination walks every project exactly once."""
+        client, _ = authenticated_client
+
+        for i in range(7):
+            await client.post("/api/projects", json={"title": f"Project {i}"})
+
+        seen: list[int] = []
+        cursor = None
+        for _ in range(3):
+            url = "/api/projects/cursor?limit=3"
+            if cursor:
+                url += f"&cursor={cursor}"
+            response = await client.get(url)
+            assert response.status_code == 200
+            data = response.json()
+            seen.extend(p["id"] for p in data["items"])
+            cursor = data["next_cursor"]
+            assert data["has_more"] is (cursor is not None)
+
+        assert len(seen) == 7
+        assert len(set(seen)) == 7
+        assert cursor is None
+
+        response = await client.get("/api/projects/cursor?cursor=not-a-cursor")
+        assert response.status_code == 400
+
+    async def test_stream_projects_ndjson(
+        self, authenticated_client: tuple[AsyncClient, dict]
+    ):
+        """Verify the NDJSON stream yields one summary per line."""
+        client, _ = authenticated_client
+
+        for i in range(3):
+            await client.post("/api/projects", json={"title": f"Project {i}"})
+
+        response = await client.get("/api/projects/stream")
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert sorted(p["title"] for p in lines) == ["Project 0", "Project 1", "Project 2"]
+        assert all(p["sources_count"] == 0 for p in lines)
+
     async def test_list_projects_includes_counts(
         self, authenticated_client: tuple[AsyncClient, dict]
     ):
@@ -183,6 +231,41 @@ class TestProjectListing:
         assert len(projects) == 1
         assert projects[0]["sources_count"] == 2
 
+    async def test_list_projects_query_count_is_constant(
+        self, authenticated_client: tuple[AsyncClient, dict]
+    ):
+        """Verify that listing issues the same number of queries for 1 or 6 projects."""
+        from sqlalchemy import event
+        from app.db.session import engine
+
+        client, _ = authenticated_client
+        statements: list[str] = []
+
+        def count_statement(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        async def count_list_queries() -> int:
+            statements.clear()
+            event.listen(engine.sync_engine, "before_cursor_execute", count_statement)
+            try:
+                response = await client.get("/api/projects/paginated?limit=20")
+            finally:
+                event.remove(engine.sync_engine, "before_cursor_execute", count_statement)
+            assert response.status_code == 200
+            return len(statements)
+
+        for i in range(6):
+            project_response = await client.post("/api/projects", json={"title": f"Project {i}"})
+            await client.post(
+                f"/api/projects/{project_response.json()['id']}/sources",
+                json={"type": "document", "title": "Source", "content": "Test"},
+            )
+            if i == 0:
+                single = await count_list_queries()
+
+        assert await count_list_queries() == single
+        assert single <= 3
+
 
 @pytest.mark.anyio
 class TestProjectDetail:
@@ -0,0 +1,70 @@
+"""
+Unit tests for keyword search and freshness checks on indexed collections.
+"""
+from collections import OrderedDict
+
+from app.services import embedding
+from app.services.embedding import ChunkResult, EmbeddingService, IndexedCollection
+
+
+def _indexed(chunks: list[str]) -> IndexedCollection:
+    indexed = IndexedCollection(collection=None, source_hash="")
+    indexed.documents = chunks
+    indexed.lowered = [chunk.lower() for chunk in chunks]
+    indexed.build_postings()
+    return indexed
+
+
+def test_keyword_hits_match_inside_longer_words():
+    """Test that a query word also matches chunks where it is part of a longer word."""
+    indexed = _indexed(["La catégorie principale", "Le cat est noir", "Un chien"])
+
+    assert indexed.keyword_hits("cat") == [0, 1]
+    # Served from the remembered anchor scan the second time
+    assert indexed.keyword_hits("cat") == [0, 1]
+
+
+def test_keyword_hits_match_partial_edge_words():
+    """Test that partial first and last words of a phrase still match."""
+    indexed = _indexed(["une catégorie principale", "le cat principal"])
+
+    assert indexed.keyword_hits("égorie princ") == [0]
+    assert indexed.keyword_hits("cat princ") == [1]
+
+
+def test_rebuilding_postings_forgets_anchor_scans():
+    """Test that re-indexing drops candidate lists computed for the old chunks."""
+    indexed = _indexed(["le cat est noir"])
+    assert indexed.keyword_hits("cat") == [0]
+
+    indexed.documents = ["un chien", "la catégorie"]
+    indexed.lowered = [chunk.lower() for chunk in indexed.documents]
+    indexed.build_postings()
+
+    assert indexed.keyword_hits("cat") == [1]
+
+
+def test_semantic_cache_is_keyed_by_top_k():
+    """Test that results cached for one top_k aren't served for another."""
+    indexed = _indexed(["Le cat est noir"])
+    results = [ChunkResult(source_id=1, source_title="Cours", content="Le cat est noir", score=0.9)]
+    indexed.remember_results((3, "quel animal"), [1.0, 0.0], results)
+
+    assert indexed.cached_results((3, "quel animal")) == results
+    assert indexed.cached_results((5, "quel animal")) is None
+    assert indexed.similar_results([1.0, 0.0], top_k=5) is None
+    assert indexed.similar_results([1.0, 0.0], top_k=3) == results
+
+
+def test_project_index_freshness_from_fingerprints(monkeypatch):
+    """Test that id/title/hash columns are enough to tell an index is current."""
+    monkeypatch.setattr(embedding, "_collections", OrderedDict())
+    indexed = _indexed(["Le cat est noir"])
+    indexed.source_hash = embedding._source_hash({1: "abc"}, {1: "Cours"})
+    embedding._store_collection("project_7", indexed)
+    service = EmbeddingService(user=None)
+
+    assert service.is_project_indexed(7, [(1, "Cours", "abc")])
+    assert not service.is_project_indexed(7, [(1, "Cours renommé", "abc")])
+    assert not service.is_project_indexed(7, [(1, "Cours", "abc"), (2, "TD", "def")])
+    assert not service.is_project_indexed(8, [(1, "Cours", "abc")])
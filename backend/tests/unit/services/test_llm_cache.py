@@ -0,0 +1,45 @@
+"""
+Unit tests for the in-process LLM response cache.
+"""
+from app.services.llm_cache import LLMResponseCache, make_cache_key
+
+
+def test_cache_key_is_order_independent():
+    """Test that keyword order does not change the cache key."""
+    key_a = make_cache_key(provider="mistral", document_type="cours", sources=["a", "b"])
+    key_b = make_cache_key(sources=["a", "b"], document_type="cours", provider="mistral")
+    assert key_a == key_b
+    assert key_a != make_cache_key(provider="mistral", document_type="quiz", sources=["a", "b"])
+
+
+async def test_get_returns_stored_value_and_counts_hits():
+    """Test hit/miss accounting around a stored response."""
+    cache = LLMResponseCache()
+
+    assert await cache.get("key") is None
+    await cache.set("key", "# Markdown")
+    assert await cache.get("key") == "# Markdown"
+    assert cache.stats() == {"hits": 1, "misses": 1, "size": 1}
+
+
+async def test_expired_entries_are_dropped():
+    """Test that entries past their TTL are treated as misses."""
+    cache = LLMResponseCache()
+
+    await cache.set("key", "stale", ttl=-1)
+    assert await cache.get("key") is None
+    assert cache.stats()["size"] == 0
+
+
+async def test_least_recently_used_entry_is_evicted():
+    """Test that the cache stays within max_entries."""
+    cache = LLMResponseCache(max_entries=2)
+
+    await cache.set("a", "1")
+    await cache.set("b", "2")
+    await cache.get("a")
+    await cache.set("c", "3")
+
+    assert await cache.get("b") is None
+    assert await cache.get("a") == "1"
+    assert await cache.get("c") == "3"
@@ -0,0 +1,135 @@
+"""
+Unit tests for the concurrent source processing job.
+"""
+import asyncio
+from collections import namedtuple
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.models import Base, JobStatus, ProcessingJob, Project, Source, SourceType, User
+from app.services import jobs
+from app.services.projects import ProjectService
+
+PendingSource = namedtuple("PendingSource", ["id", "title", "type"])
+
+
+class FakeProcessor:
+    """Processor stub that records how many sources it handles at once."""
+
+    def __init__(self, failing: set[str] | None = None):
+        self.failing = failing or set()
+        self.active = 0
+        self.max_active = 0
+        self.processed: list[str] = []
+
+    async def process(self, file_path: Path):
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(0.01)
+        finally:
+            self.active -= 1
+        if file_path.name in self.failing:
+            return SimpleNamespace(success=False, error="boom", processed_content=None)
+        self.processed.append(file_path.name)
+        return SimpleNamespace(success=True, error=None, processed_content=f"text of {file_path.name}")
+
+
+@pytest.fixture
+async def session(tmp_path):
+    """Provide a session on a fresh SQLite database."""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'jobs.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)() as session:
+        yield session
+    await engine.dispose()
+
+
+@pytest.fixture
+def processor(monkeypatch) -> FakeProcessor:
+    """Route every source to one FakeProcessor, with an API key available."""
+    fake = FakeProcessor()
+
+    async def get_effective_api_key(user, session):
+        return "test-api-key"
+
+    monkeypatch.setattr(
+        "app.services.api_key_resolver.get_effective_api_key", get_effective_api_key
+    )
+    monkeypatch.setattr(jobs, "_get_processor", lambda *args: fake)
+    monkeypatch.setattr(jobs.settings, "max_processing_concurrency", 2)
+    return fake
+
+
+async def _project_with_audio_sources(session: AsyncSession, count: int) -> int:
+    user = User(email="owner@example.com", hashed_password="x")
+    project = Project(owner=user, title="Lectures")
+    session.add_all([user, project])
+    await session.flush()
+    session.add_all([
+        Source(
+            project_id=project.id,
+            type=SourceType.AUDIO,
+            title=f"Lecture {i}",
+            file_path=f"/audio/lecture-{i}.mp3",
+            source_metadata={"mime_type": "audio/mpeg"},
+        )
+        for i in range(count)
+    ])
+    await session.commit()
+    return project.id
+
+
+async def _job_status(session: AsyncSession, project_id: int) -> ProcessingJob:
+    result = await session.execute(
+        select(ProcessingJob).where(ProcessingJob.project_id == project_id)
+    )
+    return result.scalar_one()
+
+
+async def test_sources_are_processed_within_the_concurrency_bound(session, processor):
+    """Test that all sources are processed, at most max_processing_concurrency at once."""
+    project_id = await _project_with_audio_sources(session, 5)
+
+    await jobs._run_processing_job_impl(project_id, "mistral", session)
+
+    assert sorted(processor.processed) == [f"lecture-{i}.mp3" for i in range(5)]
+    assert processor.max_active == 2
+    job = await _job_status(session, project_id)
+    assert job.status == JobStatus.SUCCEEDED
+
+
+async def test_vanished_source_is_skipped(session, processor, monkeypatch):
+    """Test that a source deleted after being listed doesn't fail the job."""
+    project_id = await _project_with_audio_sources(session, 2)
+    list_pending = ProjectService.get_pending_processing_sources
+
+    async def with_deleted_source(self, project_id):
+        rows = await list_pending(self, project_id)
+        return [*rows, PendingSource(id=9999, title="Deleted", type=SourceType.AUDIO)]
+
+    monkeypatch.setattr(ProjectService, "get_pending_processing_sources", with_deleted_source)
+
+    await jobs._run_processing_job_impl(project_id, "mistral", session)
+
+    assert len(processor.processed) == 2
+    job = await _job_status(session, project_id)
+    assert job.status == JobStatus.SUCCEEDED
+
+
+async def test_failing_source_fails_the_job(session, processor):
+    """Test that one failing source marks the job FAILED with its title."""
+    project_id = await _project_with_audio_sources(session, 3)
+    processor.failing.add("lecture-1.mp3")
+
+    await jobs._run_processing_job_impl(project_id, "mistral", session)
+
+    job = await _job_status(session, project_id)
+    assert job.status == JobStatus.FAILED
+    assert "Lecture 1" in job.error
+    assert processor.max_active <= 2
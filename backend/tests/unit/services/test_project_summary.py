@@ -0,0 +1,76 @@
+"""
+Unit tests for the cached project summaries.
+"""
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+from pydantic import ValidationError
+
+from app.models import JobStatus
+from app.schemas.project import ProjectDetail
+from app.services.projects import ProjectService
+
+CREATED_AT = datetime(2026, 1, 5, 9, 30, tzinfo=UTC)
+
+
+def _project(processing_job=None, generation_job=None, title="Lectures"):
+    return SimpleNamespace(
+        id=1,
+        title=title,
+        created_at=CREATED_AT,
+        processing_job=processing_job,
+        generation_job=generation_job,
+    )
+
+
+@pytest.fixture
+def service() -> ProjectService:
+    return ProjectService(session=None, user=None, file_service=None)
+
+
+def test_unchanged_project_reuses_summary(service):
+    """Test that identical inputs return the cached summary."""
+    first = service._to_summary(_project(), 2, 0)
+    assert service._to_summary(_project(), 2, 0) is first
+
+
+def test_job_transition_produces_fresh_summary(service):
+    """Test that a job status change misses the cache and leaves the old summary intact."""
+    job = SimpleNamespace(status=JobStatus.IN_PROGRESS, updated_at=CREATED_AT, error=None)
+    processing = service._to_summary(_project(processing_job=job), 1, 0)
+
+    job.status = JobStatus.SUCCEEDED
+    job.updated_at = CREATED_AT + timedelta(minutes=5)
+    processed = service._to_summary(_project(processing_job=job), 1, 0)
+
+    assert processed is not processing
+    assert processing.processing_status.status == JobStatus.IN_PROGRESS
+    assert processed.processing_status.status == JobStatus.SUCCEEDED
+    assert processed.status_updated_at == CREATED_AT + timedelta(minutes=5)
+
+
+def test_cached_summary_cannot_be_mutated(service):
+    """Test that summaries shared across requests are frozen."""
+    job = SimpleNamespace(status=JobStatus.FAILED, updated_at=CREATED_AT, error="boom")
+    summary = service._to_summary(_project(generation_job=job), 1, 0)
+
+    with pytest.raises(ValidationError):
+        summary.title = "Renamed"
+    with pytest.raises(ValidationError):
+        summary.document_status.error = None
+
+
+def test_project_detail_stays_mutable():
+    """Test that freezing the cached summaries doesn't freeze ProjectDetail."""
+    detail = ProjectDetail(
+        id=1,
+        title="Lectures",
+        created_at=CREATED_AT,
+        description=None,
+        sources=[],
+        documents=[],
+    )
+
+    detail.title = "Renamed"
+    assert detail.title == "Renamed"
@@ -0,0 +1,65 @@
+"""
+Unit tests for the in-process job queue.
+"""
+import asyncio
+
+from app.workers.queue import JobQueue
+
+
+async def test_enqueued_jobs_run_with_their_arguments():
+    """Test that a worker runs each job with the project ID and arguments."""
+    calls = []
+    done = asyncio.Event()
+
+    async def job(project_id, provider, *, title=None):
+        calls.append((project_id, provider, title))
+        done.set()
+
+    queue = JobQueue("test", concurrency=1)
+    queue.enqueue(job, 1, "mistral", title="Notes")
+    await asyncio.wait_for(done.wait(), 1)
+    await queue.stop(timeout=1)
+
+    assert calls == [(1, "mistral", "Notes")]
+
+
+async def test_stop_drains_queued_jobs_within_timeout():
+    """Test that stop lets queued jobs finish instead of dropping them."""
+    finished = []
+    abandoned = []
+
+    async def job(project_id):
+        await asyncio.sleep(0.01)
+        finished.append(project_id)
+
+    async def on_abandoned(project_id):
+        abandoned.append(project_id)
+
+    queue = JobQueue("test", concurrency=1, on_abandoned=on_abandoned)
+    for project_id in (1, 2, 3):
+        queue.enqueue(job, project_id)
+    await queue.stop(timeout=1)
+
+    assert finished == [1, 2, 3]
+    assert abandoned == []
+
+
+async def test_stop_reports_cancelled_and_dropped_jobs():
+    """Test that jobs still running or queued after the timeout are reported."""
+    started = asyncio.Event()
+    abandoned = []
+
+    async def stuck_job(project_id):
+        started.set()
+        await asyncio.Event().wait()
+
+    async def on_abandoned(project_id):
+        abandoned.append(project_id)
+
+    queue = JobQueue("test", concurrency=1, on_abandoned=on_abandoned)
+    queue.enqueue(stuck_job, 1)
+    queue.enqueue(stuck_job, 2)
+    await asyncio.wait_for(started.wait(), 1)
+    await queue.stop(timeout=0.01)
+
+    assert abandoned == [1, 2]